@@ -67,6 +67,16 @@ class BotController:
         self.model.set_status(BotStatus.CONFIGURING)
         return self.model.get_options_view(parent)
 
+    def reopen_options(self) -> None:
+        """Resume configuring options in response to the Options button being clicked.
+
+        The view reuses the options view it built previously (which still shows the
+        saved options), so the model is told it is being configured again without
+        building a new one.
+        """
+        self.model.set_status(BotStatus.CONFIGURING)
+        self.model.reopen_options_view()
+
     def save_options(self, options) -> None:
         """Save the options view in response to left-clicking Save.
 
@@ -90,22 +100,23 @@ class BotController:
     def update_status(self) -> None:
         """Update the bot's general status as displayed on the `BotView`.
 
-        The model tells the view to update bot's status."""
+        The model tells the view to update bot's status. As with all model-to-view
+        updates, this is queued to run on the UI thread."""
         status = self.model.status
         if status == BotStatus.RUNNING:
-            self.view.frame_info.update_status_running()
+            self.view.post(self.view.frame_info.update_status_running)
         elif status == BotStatus.STOPPED:
-            self.view.frame_info.update_status_stopped()
+            self.view.post(self.view.frame_info.update_status_stopped)
         elif status == BotStatus.CONFIGURING:
-            self.view.frame_info.update_status_configuring()
+            self.view.post(self.view.frame_info.update_status_configuring)
         elif status == BotStatus.CONFIGURED:
-            self.view.frame_info.update_status_configured()
+            self.view.post(self.view.frame_info.update_status_configured)
 
     def update_progress(self) -> None:
         """Update the bot's progress bar and percentage as displayed on the `BotView`.
 
         The model tells the view to update the bot's current progress."""
-        self.view.frame_info.update_progress(self.model.progress)
+        self.view.post(self.view.frame_info.update_progress, self.model.progress)
 
     def update_log(self, msg: str, overwrite: bool = False) -> None:
         """Update the output log with a given message.
@@ -117,14 +128,14 @@ class BotController:
             overwrite (bool, optional): Overwrites the previous message in the console
                 log. Defaults to False.
         """
-        self.view.frame_output_log.update_log(msg, overwrite)
+        self.view.post(self.view.frame_output_log.update_log, msg, overwrite)
 
     def clear_log(self) -> None:
         """Clear the output log.
 
         The model tells the view to clear the log.
         """
-        self.view.frame_output_log.clear_log()
+        self.view.post(self.view.frame_output_log.clear_log)
 
     def change_model(self, model: Bot) -> None:
         """Swap the controller's model, halting the old one.
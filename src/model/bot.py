@@ -166,6 +166,11 @@ class Bot(ABC):
         self.options_builder.options = {}
         return view
 
+    def reopen_options_view(self) -> None:
+        """Log the reopening of the bot's previously built options view."""
+        self.clear_log()
+        self.log_msg("Options panel opened.")
+
     def play(self) -> None:
         """Launch the bot.
 
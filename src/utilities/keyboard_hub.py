@@ -0,0 +1,111 @@
+import threading
+from typing import Callable, Optional, Tuple
+
+import pynput.keyboard as keyboard
+
+KeyCallback = Callable[[keyboard.Key], None]
+
+# A single application-wide `keyboard.Listener`, so that views listening for keys at
+# the same time share one OS-level keyboard hook rather than installing one each.
+_LISTENER: Optional[keyboard.Listener] = None
+_LOCK = threading.Lock()
+# Subscribers are kept in tuples that are replaced, never mutated, so the listener
+# thread can iterate over them without holding the lock.
+_ON_PRESS: Tuple[KeyCallback, ...] = ()
+_ON_RELEASE: Tuple[KeyCallback, ...] = ()
+
+
+def subscribe(
+    on_press: Optional[KeyCallback] = None, on_release: Optional[KeyCallback] = None
+) -> None:
+    """Register callbacks for key press and release events.
+
+    The shared keyboard listener is started when its first callbacks are registered.
+    Note that callbacks are run on the listener's thread, not the UI thread.
+
+    Args:
+        on_press (Optional[KeyCallback], optional): Called with each pressed key.
+            Defaults to None.
+        on_release (Optional[KeyCallback], optional): Called with each released key.
+            Defaults to None.
+    """
+    global _LISTENER, _ON_PRESS, _ON_RELEASE
+    with _LOCK:
+        if on_press is not None:
+            _ON_PRESS += (on_press,)
+        if on_release is not None:
+            _ON_RELEASE += (on_release,)
+        if _LISTENER is None and (_ON_PRESS or _ON_RELEASE):
+            # A stopped `keyboard.Listener` cannot be restarted, so make a new one.
+            _LISTENER = keyboard.Listener(
+                on_press=_dispatch_press, on_release=_dispatch_release
+            )
+            _LISTENER.start()
+
+
+def unsubscribe(
+    on_press: Optional[KeyCallback] = None, on_release: Optional[KeyCallback] = None
+) -> None:
+    """Remove callbacks previously registered with `subscribe`.
+
+    The shared keyboard listener is stopped once no callbacks remain. Removing a
+    callback that is not registered does nothing.
+
+    Args:
+        on_press (Optional[KeyCallback], optional): The key press callback to remove.
+            Defaults to None.
+        on_release (Optional[KeyCallback], optional): The key release callback to
+            remove. Defaults to None.
+    """
+    global _LISTENER, _ON_PRESS, _ON_RELEASE
+    with _LOCK:
+        _ON_PRESS = _without(_ON_PRESS, on_press)
+        _ON_RELEASE = _without(_ON_RELEASE, on_release)
+        if _LISTENER is not None and not (_ON_PRESS or _ON_RELEASE):
+            _LISTENER.stop()
+            _LISTENER = None
+
+
+def _without(
+    callbacks: Tuple[KeyCallback, ...], callback: Optional[KeyCallback]
+) -> Tuple[KeyCallback, ...]:
+    """Return the given callbacks with the first occurrence of `callback` removed.
+
+    Args:
+        callbacks (Tuple[KeyCallback, ...]): The registered callbacks.
+        callback (Optional[KeyCallback]): The callback to remove, if any.
+
+    Returns:
+        Tuple[KeyCallback, ...]: The remaining callbacks.
+    """
+    if callback is None or callback not in callbacks:
+        return callbacks
+    i = callbacks.index(callback)
+    return callbacks[:i] + callbacks[i + 1 :]
+
+
+def _notify(callbacks: Tuple[KeyCallback, ...], key: keyboard.Key) -> None:
+    """Call each subscriber with the given key, isolating any subscriber's errors.
+
+    pynput stops its listener if a callback raises, which would silence every other
+    subscriber's hotkeys, so errors are reported and then swallowed instead.
+
+    Args:
+        callbacks (Tuple[KeyCallback, ...]): The subscribers to notify.
+        key (keyboard.Key): The key that was pressed or released.
+    """
+    for callback in callbacks:
+        try:
+            callback(key)
+        except Exception as e:
+            print(f"Keyboard callback {callback!r} failed: {e!r}")
+
+
+def _dispatch_press(key: keyboard.Key) -> None:
+    """Forward a key press from the shared listener to every subscriber."""
+    _notify(_ON_PRESS, key)
+
+
+def _dispatch_release(key: keyboard.Key) -> None:
+    """Forward a key release from the shared listener to every subscriber."""
+    _notify(_ON_RELEASE, key)
@@ -160,14 +160,15 @@ class OptionsUI(ctk.CTkScrollableFrame):
         self.controller = controller
 
         # Configure a grid layout.
-        self.num_of_options = len(option_info.keys())
-        self.rowconfigure(0, weight=0)  # Title
-        for i in range(self.num_of_options):
-            self.rowconfigure(i + 1, weight=0)
+        self.num_of_options = len(option_info)
+        # The title row, one row per option, and the Save button row share a weight of
+        # 0, so they are configured in a single Tk call.
+        self.rowconfigure(
+            (*range(self.num_of_options + 1), self.num_of_options + 2), weight=0
+        )
         self.rowconfigure(
             self.num_of_options + 1, weight=1
         )  # Spacing between the Save button and the options widgets.
-        self.rowconfigure(self.num_of_options + 2, weight=0)  # The Save button row.
         self.columnconfigure(0, weight=3, uniform="column_uniform")
         self.columnconfigure(1, weight=4, uniform="column_uniform")
 
@@ -278,8 +279,8 @@ class OptionsUI(ctk.CTkScrollableFrame):
         self.labels[key].grid(row=row, column=0, padx=10, pady=20)
         # Checkbox frame.
         self.frames[key] = ctk.CTkFrame(master=self)
-        for i in range(len(value.values)):
-            self.frames[key].columnconfigure(i, weight=1)
+        if value.values:
+            self.frames[key].columnconfigure(tuple(range(len(value.values))), weight=1)
         self.frames[key].grid(row=row, column=1, sticky="ew", padx=(10, 10))
         # Checkbox values.
         self.widgets[key] = []  # Type is `List[ctk.CTkCheckBox]`.
@@ -350,8 +351,8 @@ class OptionsUI(ctk.CTkScrollableFrame):
         """Save the user-selected options and pass them to the `BotController`.
 
         This method collects all option values from the widgets, sends them to the
-        `BotController` for further processing, and then closes the options pop-up
-        window.
+        `BotController` for further processing, and then hides the options pop-up
+        window so that it can be shown again later.
 
         Args:
             window (ctk.CTkToplevel): The parent window that hosts the options UI.
@@ -368,7 +369,7 @@ class OptionsUI(ctk.CTkScrollableFrame):
                 self.options[key] = value.get()
         # Send the newly-saved options to the controller.
         self.controller.save_options(self.options)
-        window.destroy()
+        window.withdraw()
 
 
 class OptionsBuilder:
@@ -7,6 +7,14 @@ import numpy as np
 # here avoids a circular import error when running `utilities.ocr` directly for testing.
 Point = NamedTuple("Point", x=int, y=int)
 
+# A single OS-entropy RNG shared by the scalar samplers below.
+_SYSRNG = secrets.SystemRandom()
+
+# Probabilities of selecting the lower or upper mean in `biased_trunc_norm_samp`. Each
+# weight is proportional to the squared (1-based) index of its mean: 1/5 and 4/5.
+_P_PREFER_LO = (4 / 5, 1 / 5)
+_P_PREFER_HI = (1 / 5, 4 / 5)
+
 
 def random_point_around(point: Point, xpad: int, ypad: int) -> Point:
     """Return a pixel coordinate drawn from a Gaussian bell around a point.
@@ -36,10 +44,9 @@ def random_point_in(xmin: int, ymin: int, width: int, height: int) -> Point:
     Returns:
         Point: A random pixel coordinate within the bounding box.
     """
-    rng = secrets.SystemRandom()
     # Calculate the dimensions and position of an inner bounding box within the full
     # bounding box. This padding improves reliability.
-    padding_factor = rng.uniform(0.10, 0.15)
+    padding_factor = _SYSRNG.uniform(0.10, 0.15)
     inner_xmin = round(xmin + width * padding_factor)
     inner_ymin = round(ymin + height * padding_factor)
     inner_width = round(width * (1.000 - (padding_factor * 2)))
@@ -104,10 +111,9 @@ def trunc_norm_samp(lo: float, hi: float, mean=None, std=None) -> float:
     """
     mean = (lo + hi) / 2 if mean is None else mean
     std = (hi - lo) / 6 if std is None else std
-    rng = secrets.SystemRandom()
-    sample = rng.gauss(mean, std)
+    sample = _SYSRNG.gauss(mean, std)
     while sample < lo or sample > hi:
-        sample = rng.gauss(mean, std)
+        sample = _SYSRNG.gauss(mean, std)
     return sample
 
 
@@ -137,17 +143,11 @@ def biased_trunc_norm_samp(lo: float, hi: float, prefer_hi: bool = False) -> flo
         lo + (hi - lo) * (1 / 3),
         lo + (hi - lo) * (2 / 3),
     ]
-    # Generate probabilities for each mean proportional to the index.
-    p = [
-        (i + 1) ** 2 / sum([(j + 1) ** 2 for j in range(len(means))])
-        for i in range(len(means))
-    ]
-    if not prefer_hi:
-        p = p[::-1]  # Reversed to prefer the lower bound.
     # Select a mean from the list with a probability proportional to the index.
     # With two means, we have an 80% preference one of them, and which one depends how
-    # how `p` is ordered.
-    index = np.random.choice(range(len(means)), p=p)
+    # how `p` is ordered. A single Bernoulli draw avoids `np.random.choice` overhead.
+    p = _P_PREFER_HI if prefer_hi else _P_PREFER_LO
+    index = 1 if _SYSRNG.random() < p[1] else 0
     mean = means[index]
     # Retrieve a sample from the truncated normal distribution.
     return trunc_norm_samp(lo, hi, mean=mean)
@@ -199,7 +199,7 @@ def random_chance(prob: float) -> bool:
         raise TypeError("Probability must be a float")
     if prob < 0.000 or prob > 1.000:
         raise ValueError("Probability must be between 0 and 1")
-    return secrets.SystemRandom().random() <= prob
+    return _SYSRNG.random() <= prob
 
 
 if __name__ == "__main__":
@@ -1,23 +1,61 @@
+import copy
+import functools
+import os
 import pickle
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pynput.keyboard as keyboard
 
 SETTINGS_PATH = Path(__file__).parents[1].joinpath("settings.pickle")
+# String forms of the settings paths, resolved once rather than on every file access.
+_SETTINGS_PATH_STR = str(SETTINGS_PATH)
+_SETTINGS_TMP_PATH_STR = str(SETTINGS_PATH.with_suffix(".pickle.tmp"))
+# Read and write settings in large chunks rather than many small buffered calls.
+_IO_BUFFER_SIZE = 1 << 20
+
+# In-memory copy of `settings.pickle`, along with the file modification time it was
+# read at. The file is only re-read if it has changed on disk since.
+_CACHE: Optional[Dict[str, Any]] = None
+_CACHE_MTIME: int = -1
 
 
 def load_settings_file() -> Dict[str, Any]:
     """Open `src/settings.pickle` and load its data into a dictionary.
 
+    Note that the loaded data is cached in memory and only re-read from disk when the
+    file's modification time changes.
+
     Returns:
         Dict[str, Any]: A dictionary containing the loaded data.
     """
-    with open(SETTINGS_PATH, "rb") as file:
+    global _CACHE, _CACHE_MTIME
+    mtime = os.stat(_SETTINGS_PATH_STR).st_mtime_ns
+    if _CACHE is not None and mtime == _CACHE_MTIME:
+        return _CACHE
+    with open(_SETTINGS_PATH_STR, "rb", buffering=_IO_BUFFER_SIZE) as file:
         data = pickle.load(file)
+    _CACHE, _CACHE_MTIME = data, mtime
     return data
 
 
+def _save_settings_file(data: Dict[str, Any]) -> None:
+    """Write the given data to `src/settings.pickle` and refresh the in-memory cache.
+
+    Callers modify a copy of the cached settings and pass it here, so the cache is only
+    replaced once the new settings are safely on disk.
+
+    Args:
+        data (Dict[str, Any]): The full settings dictionary to save.
+    """
+    global _CACHE, _CACHE_MTIME
+    # Write to a temporary file first so a crash mid-write cannot corrupt the settings.
+    with open(_SETTINGS_TMP_PATH_STR, "wb", buffering=_IO_BUFFER_SIZE) as file:
+        pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(_SETTINGS_TMP_PATH_STR, _SETTINGS_PATH_STR)
+    _CACHE, _CACHE_MTIME = data, os.stat(_SETTINGS_PATH_STR).st_mtime_ns
+
+
 def set(key: str, value: Any) -> None:
     """Set a value in `settings.pickle` corresponding to the given key.
 
@@ -29,12 +67,28 @@ def set(key: str, value: Any) -> None:
         value (Any): The value to set for the given key.
     """
     try:
-        data = load_settings_file()
+        data = dict(load_settings_file())
     except FileNotFoundError:
         data = {}
     data[key] = value  # Update the value in the given key.
-    with open(SETTINGS_PATH, "wb") as file:  # Save the data back to the file.
-        pickle.dump(data, file)
+    _save_settings_file(data)  # Save the data back to the file.
+
+
+def update(mapping: Dict[str, Any]) -> None:
+    """Set several values in `settings.pickle` with a single write.
+
+    Note that if a `src/settings.pickle` file doesn't exist, a new one is dynamically
+    created.
+
+    Args:
+        mapping (Dict[str, Any]): The keys and corresponding values to set.
+    """
+    try:
+        data = dict(load_settings_file())
+    except FileNotFoundError:
+        data = {}
+    data.update(mapping)
+    _save_settings_file(data)
 
 
 def get(key: str) -> Optional[Any]:
@@ -51,7 +105,26 @@ def get(key: str) -> Optional[Any]:
         data = load_settings_file()
     except FileNotFoundError:
         return None
-    return data.get(key)  # Return the value corresponding to the given key.
+    # Return a shallow copy so callers mutating the value (e.g. a keybind list) do not
+    # silently alter the cached settings.
+    return copy.copy(data.get(key))
+
+
+def get_many(keys: Iterable[str]) -> Dict[str, Optional[Any]]:
+    """Retrieve several values from `settings.pickle` with a single read.
+
+    Args:
+        keys (Iterable[str]): The keys corresponding to the values to retrieve.
+
+    Returns:
+        Dict[str, Optional[Any]]: Each key mapped to its value, or to None if the key
+            was not found.
+    """
+    try:
+        data = load_settings_file()
+    except FileNotFoundError:
+        data = {}
+    return {key: copy.copy(data.get(key)) for key in keys}
 
 
 def delete(key: str) -> None:
@@ -67,12 +140,32 @@ def delete(key: str) -> None:
         FileNotFoundError: Raised if `settings.pickle` cannot be found.
     """
     try:
-        data = load_settings_file()
+        data = dict(load_settings_file())
     except FileNotFoundError:
         return
     del data[key]  # Delete the given key.
-    with open(SETTINGS_PATH, "wb") as file:  # Save the data back to the file.
-        pickle.dump(data, file)
+    _save_settings_file(data)  # Save the data back to the file.
+
+
+# Symbolic representations of special keys, as displayed in keybind text.
+_KEY_SYMBOLS: Dict[keyboard.Key, str] = {
+    keyboard.Key.enter: "↵",
+    keyboard.Key.space: "␣",
+    keyboard.Key.ctrl: "ctrl",
+    keyboard.Key.ctrl_l: "ctrl",
+    keyboard.Key.ctrl_r: "ctrl",
+    keyboard.Key.alt: "⌥",
+    keyboard.Key.alt_l: "⌥",
+    keyboard.Key.alt_r: "⌥",
+    keyboard.Key.shift_l: "L⇧",
+    keyboard.Key.shift_r: "R⇧",
+    keyboard.Key.cmd: "⌘",
+    keyboard.Key.cmd_l: "⌘",
+    keyboard.Key.cmd_r: "⌘",
+    keyboard.Key.caps_lock: "⇪",
+    keyboard.Key.tab: "⇥",
+    keyboard.Key.backspace: "⌫",
+}
 
 
 def keybind_to_text(current_keys: List[keyboard.Key]) -> str:
@@ -85,30 +178,33 @@ def keybind_to_text(current_keys: List[keyboard.Key]) -> str:
     Returns:
         str: The matching keys together in a string, each key separated by a plus sign.
     """
-    hotkeys = []
-    if current_keys:
-        for key in current_keys:
-            match key:
-                case keyboard.Key.enter:
-                    hotkeys.append("↵")
-                case keyboard.Key.space:
-                    hotkeys.append("␣")
-                case keyboard.Key.ctrl | keyboard.Key.ctrl_l | keyboard.Key.ctrl_r:
-                    hotkeys.append("ctrl")
-                case keyboard.Key.alt | keyboard.Key.alt_l | keyboard.Key.alt_r:
-                    hotkeys.append("⌥")
-                case keyboard.Key.shift_l:
-                    hotkeys.append("L⇧")
-                case keyboard.Key.shift_r:
-                    hotkeys.append("R⇧")
-                case keyboard.Key.cmd | keyboard.Key.cmd_l | keyboard.Key.cmd_r:
-                    hotkeys.append("⌘")
-                case keyboard.Key.caps_lock:
-                    hotkeys.append("⇪")
-                case keyboard.Key.tab:
-                    hotkeys.append("⇥")
-                case keyboard.Key.backspace:
-                    hotkeys.append("⌫")
-                case _:
-                    hotkeys.append(key)
-    return " + ".join(map(str, hotkeys)).replace("'", "")
+    return _keybind_to_text_cached(tuple(current_keys or ()))
+
+
+@functools.lru_cache(maxsize=256)
+def _keybind_to_text_cached(current_keys: Tuple[keyboard.Key, ...]) -> str:
+    """Convert a hashable sequence of keys into their symbolic representations.
+
+    Note that results are cached, as the same few keybinds are formatted repeatedly.
+    The cache is bounded, so editing many different keybinds cannot grow it forever.
+
+    Args:
+        current_keys (Tuple[keyboard.Key, ...]): A tuple of `pynput.keyboard.Key`
+            elements representing a sequence of keystrokes.
+
+    Returns:
+        str: The matching keys together in a string, each key separated by a plus sign.
+    """
+    return " + ".join(key_to_text(key) for key in current_keys)
+
+
+def key_to_text(key: keyboard.Key) -> str:
+    """Convert a single key into its symbolic representation.
+
+    Args:
+        key (keyboard.Key): The `pynput.keyboard.Key` to convert.
+
+    Returns:
+        str: The key's symbol, or its name if it has no symbol.
+    """
+    return (_KEY_SYMBOLS.get(key) or str(key)).replace("'", "")
@@ -1,12 +1,20 @@
 import os
 import re
+import shelve
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
 from pathlib import Path
-from typing import Callable, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as StreamError
+from urllib3.util.retry import Retry
 
 # When `sprite_scraper` is run directly, go up one directory to import `img_search`.
 if __name__ == "__main__":
@@ -16,6 +24,16 @@ if __name__ == "__main__":
 
 import utilities.img_search as imsearch
 
+# Separators used to split a comma-separated search string into image names.
+_ARG_SEP = re.compile(r"\s*,\s*")
+_WS = re.compile(r"\s+")
+# The sprite filename within an item's info box wikitext (e.g. "[[File:Shark.png]]").
+_INFOBOX_FILE = re.compile(r"\[\[File:(.*?)\]\]")
+# The first bytes of every PNG file.
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Words left lowercase when capitalizing each word of an image name.
+_CAP_EXCLUDE = frozenset({"from", "of", "to", "in", "with", "on", "at", "by", "for"})
+
 
 class ImageType(IntEnum):
     NORMAL = 0
@@ -23,6 +41,9 @@ class ImageType(IntEnum):
     ALL = 2
 
 
+_VALID_IMAGE_TYPES = frozenset(ImageType)
+
+
 class SpriteScraper:
     """Download game sprites via the OSRS wiki API."""
 
@@ -30,6 +51,27 @@ class SpriteScraper:
         """Instantiate a `SpriteScraper` to scrape sprites from the Wiki."""
         self.BASE_URL = "https://oldschool.runescape.wiki/"
         self.DEFAULT_DESTINATION = imsearch.BOT_IMAGES.joinpath("scraper")
+        self.MAX_WORKERS = 10  # Maximum number of sprites searched for concurrently.
+        # Reuse one session for all Wiki calls so connections are kept alive.
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": "RuneColorScraper/1.0"})
+        adapter = HTTPAdapter(
+            pool_connections=self.MAX_WORKERS,
+            pool_maxsize=self.MAX_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        self.session.mount("https://", adapter)
+        # Info box lookups are cached in memory and on disk, keyed by item name, since
+        # they rarely change. Disk entries expire after `INFOBOX_CACHE_TTL` seconds. The
+        # disk cache sits beside `settings.pickle`, away from the scraped sprites.
+        self.INFOBOX_CACHE_PATH = (
+            Path(__file__).parents[1] / ".infobox_cache" / "infobox"
+        )
+        self.INFOBOX_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days.
+        self._infobox_memo: Dict[str, Optional[str]] = {}
+        self._infobox_lock = threading.Lock()
+        # Per-thread scratch buffers, reused across sprites to avoid reallocation.
+        self._scratch = threading.local()
 
     def search_and_download(self, search_string: str, **kwargs) -> Path:
         """Search for and downloads the image(s) specified `search_string`.
@@ -45,31 +87,47 @@ class SpriteScraper:
                 Defaults to `DEFAULT_DESTINATION`.
             notify_callback (Callable): Callback function to notify the user. Defaults
                 to `print`.
+            png_compression (int): PNG compression level (0-9) for images encoded
+                before saving. Lower levels encode faster but produce larger files.
+                Defaults to 1.
         Returns:
             Path: Directory containing the downloaded images.
         """
         # Extract and validate keyword arguments.
-        image_type, destination, notify_callback = self.__extract_kwargs(kwargs)
+        image_type, destination, notify_callback, png_compression = (
+            self.__extract_kwargs(kwargs)
+        )
         img_names = self._format_args(search_string)
         if not img_names:
             notify_callback("No search terms entered.")
             return
 
-        # Search for each image, and if found, download it.
+        # Search for each image, and if found, download it. The searches are network
+        # bound, so they are run concurrently. Notifications are serialized with a lock
+        # since callers may assume they are only ever notified from one thread at once.
         notify_callback("Beginning search...\n")
-        completed_with_errors = False
-        for img_name in img_names:
-            notify_callback(f"Searching for {img_name}...")
-            img_url = self.__find_image_url(img_name, notify_callback)
-            if not img_url:
-                notify_callback(f"No image found for {img_name}.\n")
-                completed_with_errors = True
-                continue
-            success = self.__download_and_save_image(
-                img_name, img_url, image_type, destination, notify_callback
-            )
-            if not success:
-                completed_with_errors = True
+        lock = threading.Lock()
+
+        def locked_notify_callback(msg: str) -> None:
+            with lock:
+                notify_callback(msg)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.MAX_WORKERS, len(img_names))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._process_one,
+                    img_name,
+                    image_type,
+                    destination,
+                    locked_notify_callback,
+                    png_compression,
+                )
+                for img_name in img_names
+            ]
+            results = [future.result() for future in futures]
+        completed_with_errors = not all(results)
         if completed_with_errors:
             notify_callback(
                 "Search completed with errors. Some images may not have been saved."
@@ -78,6 +136,36 @@ class SpriteScraper:
         notify_callback(f"Search complete. Images saved to:\n{destination}.\n")
         return Path(destination)
 
+    def _process_one(
+        self,
+        img_name: str,
+        image_type: ImageType,
+        destination: str,
+        notify_callback: Callable,
+        png_compression: int,
+    ) -> bool:
+        """Search for a single image, and if found, download and save it.
+
+        Args:
+            img_name (str): The formatted name of the image to search for.
+            image_type (ImageType): Type of image to save.
+            destination (str): Destination folder to save the image within.
+            notify_callback (Callable): Callback function to notify the user.
+            png_compression (int): PNG compression level for encoded images.
+
+        Returns:
+            bool: True if the image was found, downloaded, and saved successfully,
+                False otherwise.
+        """
+        notify_callback(f"Searching for {img_name}...")
+        img_url = self.__find_image_url(img_name, notify_callback)
+        if not img_url:
+            notify_callback(f"No image found for {img_name}.\n")
+            return False
+        return self.__download_and_save_image(
+            img_name, img_url, image_type, destination, notify_callback, png_compression
+        )
+
     def _bankify_image(self, image: cv2.Mat) -> cv2.Mat:
         """Crop a base item sprite to match a bank menu sprite.
 
@@ -85,6 +173,9 @@ class SpriteScraper:
         the top of the image to remove the stack number. Cropping away the gold
         quantity numbers increases the accuracy of `utilities.imagesearch` functions.
 
+        Note that the returned frame is a scratch buffer reused by the next call made
+        from the same thread, so it should be saved (or copied) before then.
+
         Args:
             image (cv2.Mat): The image to crop, stored as matrix.
 
@@ -100,20 +191,24 @@ class SpriteScraper:
             )
             print(msg)
             return image
-        height_diff = max_height - height
-        width_diff = max_width - width
-        # Create a padded border around the sprite to center it within the 36x32 frame.
-        image = cv2.copyMakeBorder(
-            image,
-            height_diff // 2,
-            height_diff // 2,
-            width_diff // 2,
-            width_diff // 2,
-            cv2.BORDER_CONSTANT,
-            value=0,
-        )
-        image[:9, :] = 0  # Set the top 9 rows of pixels to 0.
-        return image
+        top = (max_height - height) // 2
+        left = (max_width - width) // 2
+        # Center the sprite within a zeroed 36x32 frame. Copying the sprite in starting
+        # below the top 9 rows of the frame leaves those rows at 0 in the same pass.
+        src_top = max(0, 9 - top)
+        shape = (max_height, max_width) + image.shape[2:]
+        bank_img = getattr(self._scratch, "bank_img", None)
+        if bank_img is None or bank_img.shape != shape or bank_img.dtype != image.dtype:
+            bank_img = self._scratch.bank_img = np.zeros(shape, image.dtype)
+        else:
+            # Only clear the area around the sprite, since the copy below overwrites
+            # the rest of the reused buffer.
+            bank_img[: top + src_top] = 0
+            bank_img[top + height :] = 0
+            bank_img[:, :left] = 0
+            bank_img[:, left + width :] = 0
+        bank_img[top + src_top : top + height, left : left + width] = image[src_top:]
+        return bank_img
 
     def _capitalize_each_word(self, string: str) -> str:
         """Capitalize words in a string separated by underscores, keeping them.
@@ -128,9 +223,11 @@ class SpriteScraper:
             self._capitalize_each_word("Golden_ring_of_mordor")
             >>> "Golden_Ring_of_Mordor"
         """
-        exclude = ["from", "of", "to", "in", "with", "on", "at", "by", "for"]
         return "_".join(
-            word if word in exclude else word.capitalize() for word in string.split("_")
+            [
+                word if word in _CAP_EXCLUDE else word.capitalize()
+                for word in string.split("_")
+            ]
         )
 
     def _format_args(self, arg_str: str) -> Union[List[str], List]:
@@ -156,12 +253,13 @@ class SpriteScraper:
             ""
             >>> []
         """
-        if not arg_str.strip():  # If the string is empty, return an empty list
+        arg_str = arg_str.strip()
+        if not arg_str:  # If the string is empty, return an empty list
             return []
-        arg_str = " ".join(arg_str.split())  # Reduce multiple spaces to a single space.
-        # Strip whitespace and replace spaces with underscores
+        # Split on commas (and their surrounding whitespace), then replace each run of
+        # inner whitespace with a single underscore.
         return [
-            word.strip().replace(" ", "_").capitalize() for word in arg_str.split(",")
+            _WS.sub("_", word).capitalize() for word in _ARG_SEP.split(arg_str) if word
         ]
 
     def __extract_kwargs(self, kwargs):
@@ -171,16 +269,28 @@ class SpriteScraper:
             kwargs (dict): Keyword arguments dictionary.
 
         Returns:
-            tuple: A tuple containing image type, destination directory, and user
-                callback function.
+            tuple: A tuple containing image type, destination directory, user callback
+                function, and PNG compression level.
         """
         image_type = kwargs.get("image_type", ImageType.NORMAL)
         destination = kwargs.get("destination", self.DEFAULT_DESTINATION)
         notify_callback = kwargs.get("notify_callback", print)
-        if image_type not in iter(ImageType):
+        png_compression = kwargs.get("png_compression", 1)
+        if image_type in _VALID_IMAGE_TYPES:
+            image_type = ImageType(image_type)  # Accept plain ints (e.g. 0) too.
+        else:
             notify_callback("Invalid image type argument. Assigning default value.\n")
             image_type = ImageType.NORMAL
-        return image_type, str(destination), notify_callback
+        if (
+            not isinstance(png_compression, int)
+            or isinstance(png_compression, bool)
+            or png_compression not in range(10)
+        ):
+            notify_callback(
+                "Invalid PNG compression argument. Assigning default value.\n"
+            )
+            png_compression = 1
+        return image_type, str(destination), notify_callback, png_compression
 
     def __get_item_infobox_data(self, item: str) -> Optional[str]:
         """Return a string of data from the info box for a specific item from the Wiki.
@@ -192,26 +302,57 @@ class SpriteScraper:
             Optional[str]: JSON string of the info box, or None if the item does not
                 exist or if an error occurred.
         """
+        with self._infobox_lock:
+            if item in self._infobox_memo:
+                return self._infobox_memo[item]
+            self.INFOBOX_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with shelve.open(str(self.INFOBOX_CACHE_PATH)) as cache:
+                timestamp, info_box = cache.get(item, (0, None))
+            if time.time() - timestamp < self.INFOBOX_CACHE_TTL:
+                self._infobox_memo[item] = info_box
+                return info_box
+        info_box = self.__fetch_item_infobox_data(item)
+        if info_box is not False:  # Only cache lookups that completed without error.
+            with self._infobox_lock:
+                self._infobox_memo[item] = info_box
+                # Misses are only remembered for this session, so that a page created
+                # on the Wiki later is picked up the next time the scraper runs.
+                if info_box is not None:
+                    with shelve.open(str(self.INFOBOX_CACHE_PATH)) as cache:
+                        cache[item] = (time.time(), info_box)
+        return info_box or None
+
+    def __fetch_item_infobox_data(self, item: str) -> Union[str, None, bool]:
+        """Request the info box data for a specific item from the Wiki.
+
+        Args:
+            item (str): The item name.
+
+        Returns:
+            Union[str, None, bool]: JSON string of the info box, None if the item does
+                not exist, or False if an error occurred.
+        """
         params = {
             "action": "query",
             "prop": "revisions",
             "rvprop": "content",
             "format": "json",
+            "redirects": 1,
             "titles": item,
         }
 
         try:
-            response = requests.get(url=f"{self.BASE_URL}/api.php", params=params)
+            response = self.session.get(url=f"{self.BASE_URL}/api.php", params=params)
             data = response.json()
             pages = data["query"]["pages"]
             page_id = list(pages.keys())[0]
             return None if int(page_id) < 0 else pages[page_id]["revisions"][0]["*"]
         except requests.exceptions.ConnectionError as e:
             print("Network error:", e)
-            return
+            return False
         except requests.exceptions.RequestException as e:
             print("Request failed:", e)
-            return
+            return False
 
     def __sprite_url(self, item: str) -> Optional[str]:
         """Return the sprite URL associated with `item`.
@@ -226,8 +367,7 @@ class SpriteScraper:
         if not info_box:
             print(f"{item}: Page doesn't exist.")
             return
-        pattern = r"\[\[File:(.*?)\]\]"
-        if match := re.search(pattern, info_box):
+        if match := _INFOBOX_FILE.search(info_box):
             filename = match[1]
             filename = filename.replace(" ", "_")
             return f"{self.BASE_URL}images/{filename}"
@@ -236,10 +376,11 @@ class SpriteScraper:
     def __find_image_url(
         self, img_name: str, notify_callback: Callable
     ) -> Optional[str]:
-        """Find the image URL with two attempts.
+        """Find the image URL with up to two attempts.
 
-        This function tries again after the first attempt, capitalizing each word in
-        `image_name` on the second attempt.
+        The Wiki query follows redirects, which resolves most alternate capitalizations
+        in a single request. Only if that misses does this function try again with each
+        word in `image_name` capitalized, and only if doing so changes the name.
 
         Args:
             img_name (str): The name of the image to search for.
@@ -248,13 +389,16 @@ class SpriteScraper:
         Returns:
             Optional[str]: The image URL, or None if not found.
         """
-        for attempt in range(2):
-            if attempt == 1:
-                img_name = self._capitalize_each_word(img_name)
+        img_url = self.__sprite_url(img_name)
+        if img_url is None:
+            capitalized_name = self._capitalize_each_word(img_name)
+            if capitalized_name == img_name:
+                return None
+            img_name = capitalized_name
             img_url = self.__sprite_url(img_name)
-            if img_url is not None:
-                notify_callback(f"Found sprite: {img_name}")
-                return img_url
+        if img_url is not None:
+            notify_callback(f"Found sprite: {img_name}")
+        return img_url
 
     def __download_and_save_image(
         self,
@@ -263,6 +407,7 @@ class SpriteScraper:
         image_type: ImageType,
         destination: str,
         notify_callback,
+        png_compression: int,
     ) -> bool:
         """Download the image and save it according to `image_type`.
 
@@ -272,6 +417,7 @@ class SpriteScraper:
             image_type (ImageType): Type of image to save.
             destination (str): Destination folder to save the image within.
             notify_callback (function): Callback function to notify the user.
+            png_compression (int): PNG compression level for encoded images.
 
         Returns:
             bool: True if the image was download and then saved successfully, False
@@ -279,19 +425,85 @@ class SpriteScraper:
         """
         notify_callback("Downloading image...")
         try:
-            response = requests.get(img_url)
-            downloaded_img = np.frombuffer(response.content, dtype="uint8")
+            with self.session.get(img_url, stream=True) as response:
+                response.raise_for_status()
+                if image_type == ImageType.NORMAL:
+                    response.raw.decode_content = True
+                    head = response.raw.read(len(_PNG_SIGNATURE))
+                    if head == _PNG_SIGNATURE:
+                        # The Wiki usually serves a PNG, so stream it straight to disk
+                        # rather than decoding and re-encoding it.
+                        filepath, _ = self.__sprite_filepaths(img_name, destination)
+                        self.__write_file(filepath, head, response.raw)
+                        notify_callback(f"Normal sprite saved as: {filepath.name}.\n")
+                        return True
+                    img_bytes = head + response.raw.read()
+                else:
+                    img_bytes = response.content
+            downloaded_img = np.frombuffer(img_bytes, dtype="uint8")
             downloaded_img = cv2.imdecode(downloaded_img, cv2.IMREAD_UNCHANGED)
-            self.__save_image(
-                img_name, downloaded_img, image_type, destination, notify_callback
+            if downloaded_img is None:
+                notify_callback("Image decoding error: the download is not an image.\n")
+                return False
+            return self.__save_image(
+                img_name,
+                downloaded_img,
+                image_type,
+                destination,
+                notify_callback,
+                png_compression,
+                img_bytes if img_bytes.startswith(_PNG_SIGNATURE) else None,
             )
-            return True
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, StreamError) as e:
             notify_callback(f"Network error: {e}\n")
             return False
         except cv2.error as e:
             notify_callback(f"Image decoding error: {e}\n")
             return False
+        except OSError as e:
+            notify_callback(f"Error saving image: {e}\n")
+            return False
+
+    def __write_file(self, filepath: Path, data: bytes, stream=None) -> None:
+        """Write data, followed by the rest of a stream if given, to a file.
+
+        The data is written to a temporary file in the same folder, which only replaces
+        `filepath` once fully written, so a failed download never leaves a truncated
+        sprite behind.
+
+        Args:
+            filepath (Path): The file to write.
+            data (bytes): The bytes to write first.
+            stream (optional): A file-like object whose remaining bytes are written
+                after `data`. Defaults to None.
+        """
+        tmp_path = filepath.with_name(f"{filepath.name}.part")
+        try:
+            with open(tmp_path, "wb") as file:
+                file.write(data)
+                if stream is not None:
+                    shutil.copyfileobj(stream, file)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def __sprite_filepaths(self, img_name: str, destination: str) -> Tuple[Path, Path]:
+        """Return the normal and bankified sprite filepaths for an image name.
+
+        Note that the destination folder is created if it doesn't already exist.
+
+        Args:
+            img_name (str): Name of the image to save.
+            destination (str): Destination folder to save the image within.
+
+        Returns:
+            Tuple[Path, Path]: The filepaths of the normal and bankified sprites.
+        """
+        destination: Path = Path(destination)
+        destination.mkdir(parents=True, exist_ok=True)
+        img_name = img_name.lower().replace("_", "-")
+        return destination / f"{img_name}.png", destination / f"{img_name}-bank.png"
 
     def __save_image(
         self,
@@ -300,6 +512,8 @@ class SpriteScraper:
         image_type: ImageType,
         destination: str,
         notify_callback,
+        png_compression: int,
+        img_bytes: Optional[bytes] = None,
     ) -> bool:
         """Save the image according to `image_type`.
 
@@ -309,27 +523,31 @@ class SpriteScraper:
             image_type (ImageType): Type of image to save.
             destination (str): Destination folder to save the image within.
             notify_callback (function): Callback function to notify the user.
+            png_compression (int): PNG compression level for encoded images.
+            img_bytes (Optional[bytes], optional): The original bytes of
+                `downloaded_img`, if it was downloaded as a PNG. If given, they are
+                written as-is for the normal sprite instead of re-encoding the image.
+                Defaults to None.
 
         Returns:
             bool: True if the image was successfully saved, False otherwise.
         """
-        destination: Path = Path(destination)
-        # Create the destination folder if it doesn't already exist.
-        destination.mkdir(parents=True, exist_ok=True)
-        img_name = img_name.lower().replace("_", "-")
-        filepath = destination / f"{img_name}.png"
-        filepath_bank = destination / f"{img_name}-bank.png"
+        filepath, filepath_bank = self.__sprite_filepaths(img_name, destination)
+        png_params = [cv2.IMWRITE_PNG_COMPRESSION, png_compression]
         try:
             if image_type in {ImageType.NORMAL, ImageType.ALL}:
-                cv2.imwrite(str(filepath), downloaded_img)
+                if img_bytes is not None:
+                    self.__write_file(filepath, img_bytes)
+                else:
+                    cv2.imwrite(str(filepath), downloaded_img, png_params)
                 nl = "\n"
                 notify_callback(
                     "Normal sprite saved as:"
-                    f" {filepath.name}.{nl if image_type != 2 else ''}"
+                    f" {filepath.name}.{nl if image_type != ImageType.ALL else ''}"
                 )
             if image_type in {ImageType.BANK, ImageType.ALL}:
                 cropped_img = self._bankify_image(downloaded_img)
-                cv2.imwrite(str(filepath_bank), cropped_img)
+                cv2.imwrite(str(filepath_bank), cropped_img, png_params)
                 notify_callback(f"Bankified sprite saved as: {filepath_bank.name}.\n")
             return True
         except Exception as e:
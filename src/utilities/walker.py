@@ -1,7 +1,11 @@
+import functools
 import math
 import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING, List, Literal, Tuple, Union
 
+import numpy as np
+
 if TYPE_CHECKING:
     from model import RuneLiteBot
 
@@ -13,6 +17,79 @@ from utilities.mappings import locations as loc
 WalkPath = Union[List[Point], List[Tuple[int]]]
 NamedDest = Union[str, Tuple[int, int]]
 
+# The cosine and sine of each whole-degree compass angle, indexed by degree.
+_DEG_TABLE = [
+    (math.cos(math.radians(d)), math.sin(math.radians(d))) for d in range(360)
+]
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_named_dest(name: str) -> Point:
+    """Look up a named destination (e.g. "VARROCK_SQUARE") in `utilities.locations`.
+
+    Args:
+        name (str): The name of a destination listed in `utilities.mappings.locations`.
+
+    Returns:
+        Point: The named destination, measured in tile space.
+    """
+    dest = getattr(loc, name)
+    return Point(dest[0], dest[1])
+
+
+def _ensure_points(walk_path: WalkPath) -> List[Point]:
+    """Convert a list of world point tuples into a list of `Point` objects.
+
+    Paths that already consist of `Point` objects are returned as-is, so a path is
+    only ever converted once.
+
+    Args:
+        walk_path (WalkPath): A list of `Point` objects or tuples representing an
+            (x, y, plane) world point.
+
+    Returns:
+        List[Point]: The same list of waypoints, but with `Point` objects rather than
+            tuples.
+    """
+    if walk_path and isinstance(walk_path[0], Point):
+        return walk_path
+    return [Point(world_point[0], world_point[1]) for world_point in walk_path]
+
+
+def _interpolate_waypoints(
+    xs: np.ndarray, ys: np.ndarray, max_dist: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Intersperse intermediary waypoints between the far-apart steps of a path.
+
+    Every step longer than `max_dist` tiles is split into `ceil(length / 10)` equal
+    parts. The whole path is processed with array operations, without a Python loop.
+
+    Args:
+        xs (np.ndarray): The x-coordinates of the path, measured in tiles.
+        ys (np.ndarray): The y-coordinates of the path, measured in tiles.
+        max_dist (int): The maximum number of tiles allowed between waypoints.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The x- and y-coordinates of the path with the
+            intermediary waypoints included, in order.
+    """
+    dxs, dys = np.diff(xs), np.diff(ys)
+    dists_sq = dxs * dxs + dys * dys
+    # Comparing squared distances means only the long steps ever need a square root.
+    far = dists_sq > max_dist * max_dist
+    num_parts = np.ones(len(xs), dtype=np.int64)  # The last point starts no step.
+    num_parts[:-1][far] = np.ceil(np.sqrt(dists_sq[far]) / 10)
+    # Each point is followed by `num_parts - 1` waypoints along the step after it, so
+    # the output is each point's index repeated `num_parts` times, paired with the
+    # number of parts already travelled along its step.
+    src = np.repeat(np.arange(len(xs)), num_parts)
+    part = np.arange(len(src)) - np.repeat(np.cumsum(num_parts) - num_parts, num_parts)
+    step_xs = np.append(dxs, 0) / num_parts
+    step_ys = np.append(dys, 0) / num_parts
+    new_xs = np.rint(xs[src] + part * step_xs[src]).astype(np.int32)
+    new_ys = np.rint(ys[src] + part * step_ys[src]).astype(np.int32)
+    return new_xs, new_ys
+
 
 class Walker:
     PIXELS_PER_TILE: int = 4  # There are 4 pixels per tile on a default-scale minimap.
@@ -45,25 +122,48 @@ class Walker:
         self.reset_zoom_each_embark = reset_zoom_each_embark
         self.camera_angle = None
         self.position = None
-
-    def _format_walk_path(self, walk_path_raw: List[Tuple[int]]) -> WalkPath:
-        """Convert a list of world point tuples into a list of `Point` objects.
+        # A sampled position is reused for `POSITION_TTL` seconds, since several steps
+        # of each walking iteration need our position at virtually the same moment.
+        self.POSITION_TTL = 0.05
+        self._position_time = -math.inf
+        # Recently-retrieved API paths, keyed by start, destination, and host, so the
+        # same route is never requested twice. The oldest entries are evicted first.
+        self.PATH_CACHE_SIZE = 32
+        self._path_cache: "OrderedDict[Tuple[Point, Point, str], WalkPath]" = (
+            OrderedDict()
+        )
+        # The minimap center, read once per `walk` rather than on every click.
+        self._minimap_center = None
+        # The index of the last target point along the path currently being walked,
+        # and the path's x- and y-coordinates as arrays for vectorized range checks.
+        self._last_horizon_idx = 0
+        self._path_xs = None
+        self._path_ys = None
+
+    @staticmethod
+    def _to_soa(walk_path: WalkPath) -> Tuple[np.ndarray, np.ndarray]:
+        """Split a `WalkPath` into separate arrays of x- and y-coordinates.
 
         Args:
-            walk_path_raw (List[Tuple[int]]): A list of tuples representing an (x, y,
-                plane) world point.
+            walk_path (WalkPath): The list of `Point` objects (or xy-tuples) to split.
 
         Returns:
-            WalkPath: The same list of waypoints, but with `Point` objects rather than
-                tuples.
+            Tuple[np.ndarray, np.ndarray]: The x- and y-coordinates of the path.
         """
-        return [Point(world_point[0], world_point[1]) for world_point in walk_path_raw]
+        n = len(walk_path)
+        xs = np.fromiter((p[0] for p in walk_path), dtype=np.int32, count=n)
+        ys = np.fromiter((p[1] for p in walk_path), dtype=np.int32, count=n)
+        return xs, ys
 
     def update_position(self) -> None:
         """Update the `position`, `x`, and `y` attributes.
 
         Note that the returned position is measured in game tiles (rather than pixels).
+        If the position was last read less than `POSITION_TTL` seconds ago, it is
+        reused rather than read again.
         """
+        if time.monotonic() - self._position_time < self.POSITION_TTL:
+            return
         while True:
             if posn := self.bot.get_world_point():
                 break
@@ -71,6 +171,7 @@ class Walker:
         self.position = posn
         self.x, self.y, _ = self.position  # Ignore the z-coordinate (i.e. plane).
         self.loc = Point(self.x, self.y)
+        self._position_time = time.monotonic()
 
     def update_camera_angle(self) -> None:
         """Update the `camera_angle` (measured as degrees clockwise from north)."""
@@ -92,7 +193,8 @@ class Walker:
         """
         self.update_position()
         self.update_camera_angle()
-        theta = math.radians(self.camera_angle)  # Convert degrees clockwise to radians.
+        # The compass angle is read in whole degrees clockwise from north.
+        cos_theta, sin_theta = _DEG_TABLE[round(self.camera_angle) % 360]
 
         # Convert the tile-space difference between our current location and desired
         # destination to a pixel-space difference on the minimap in a North-aligned
@@ -101,8 +203,8 @@ class Walker:
         y_reg = (self.y - dest.y) * self.PIXELS_PER_TILE
 
         # Now get the same pixel coordinate in the potentially-rotated minimap frame.
-        x_mini = round(x_reg * math.cos(theta) - y_reg * math.sin(theta))
-        y_mini = round(x_reg * math.sin(theta) + y_reg * math.cos(theta))
+        x_mini = round(x_reg * cos_theta - y_reg * sin_theta)
+        y_mini = round(x_reg * sin_theta + y_reg * cos_theta)
 
         return Point(x_mini, y_mini)
 
@@ -113,9 +215,8 @@ class Walker:
             dest (Point): The destination xy-coordinate in potentially-rotated minimap
                 pixel space.
         """
-        self.update_position()
-        if dist_mini := self.get_pixel_distance(dest):
-            minimap_center = self.bot.win.minimap.center
+        if dist_mini := self.get_pixel_distance(dest):  # Also updates our position.
+            minimap_center = self._minimap_center or self.bot.win.minimap.center
             x_new = round(minimap_center.x + dist_mini.x)
             y_new = round(minimap_center.y + dist_mini.y)
             self.bot.mouse.move_to(Point(x_new, y_new))
@@ -128,6 +229,11 @@ class Walker:
         Get the furthest-away `Point` within `self.MAX_HORIZON` tiles by searching from
         the destination `Point` backward to our current position.
 
+        Paths rarely double back on themselves, so the furthest point in range is
+        almost always shortly ahead of the previous target. The search thus starts a
+        bounded number of points past the previous target, and only falls back to
+        the rest of the path if nothing in that window is within range.
+
         Args:
             walk_path (WalkPath): A list of `Point` tuples describing our character's
                 travel path.
@@ -136,23 +242,26 @@ class Walker:
             Point: The next target point to walk to, measured in tile space.
         """
         self.update_position()
-        # Using a generator for back-to-front search improves performance.
-        try:
-            ind = next(
-                i
-                for i in range(len(walk_path) - 1, -1, -1)
-                if (
-                    abs(walk_path[i].x - self.x) <= self.MAX_HORIZON
-                    and abs(walk_path[i].y - self.y) <= self.MAX_HORIZON
-                )
-            )
-            self.bot.log_msg(
-                f"Walking progress: {ind}/{len(walk_path)}", overwrite=True
-            )
-            return walk_path[ind]
-        except StopIteration:
+        xs, ys = self._path_xs, self._path_ys
+        if xs is None or len(xs) != len(walk_path):
+            xs, ys = self._to_soa(walk_path)
+        # A point is within range if its Chebyshev distance from us is small enough.
+        in_range = (
+            np.maximum(np.abs(xs - self.x), np.abs(ys - self.y)) <= self.MAX_HORIZON
+        )
+        last_idx = len(walk_path) - 1
+        window_end = min(last_idx, self._last_horizon_idx + 2 * self.MAX_HORIZON + 1)
+        if in_range[: window_end + 1].any():
+            ind = window_end - int(np.argmax(in_range[window_end::-1]))
+        elif in_range.any():
+            ind = last_idx - int(np.argmax(in_range[::-1]))
+        else:
             msg = "Travel halted. An obstacle (e.g. a gate) may be blocking the path."
             self.bot.log_msg(msg)
+            return None
+        self._last_horizon_idx = ind
+        self.bot.log_msg(f"Walking progress: {ind}/{len(walk_path)}", overwrite=True)
+        return walk_path[ind]
 
     def has_arrived(self, dest: Point, pad: int = None) -> bool:
         """Return True if our position in tile-space is within a bounding area.
@@ -200,24 +309,23 @@ class Walker:
         Returns:
             bool: True if the specified destination was reached, False otherwise.
         """
-        walk_path = (
-            walk_path
-            if isinstance(walk_path[-1], Point)
-            else self._format_walk_path(walk_path)
-        )
+        walk_path = _ensure_points(walk_path)
         dest = dest or walk_path[-1]
+        self._last_horizon_idx = 0
+        self._path_xs, self._path_ys = self._to_soa(walk_path)
+        mouse = self.bot.mouse
 
         try:
+            self._minimap_center = self.bot.win.minimap.center
             embarking = True
             self.bot.log_msg("Embarking...")
             while not self.has_arrived(dest):
                 new_pos = self.get_target_posn(walk_path)
                 if self.reset_zoom_each_embark and embarking:
-                    minimap_center = self.bot.win.minimap.center
-                    self.bot.mouse.move_to(
-                        rd.random_point_around(minimap_center, xpad=10, ypad=10)
+                    mouse.move_to(
+                        rd.random_point_around(self._minimap_center, xpad=10, ypad=10)
                     )
-                    self.bot.mouse.right_click()
+                    mouse.right_click()
                     embarking = False
                 if self.has_arrived(dest):  # Double-checking helps us stop gracefully.
                     break
@@ -230,6 +338,9 @@ class Walker:
             )
             self.bot.log_msg(msg)
             return False
+        finally:
+            self._minimap_center = None  # The window may move between trips.
+            self._path_xs = self._path_ys = None
 
     def walk_to(
         self, dest: Union[NamedDest, Point], host: Literal["dax", "osrspf"] = "dax"
@@ -256,11 +367,10 @@ class Walker:
         """
         self.update_position()
         dest = (  # `dest` is a `Point` measured in tile space.
-            getattr(loc, dest)  # If named, look up in `utilities.mappings.locations`.
+            _resolve_named_dest(dest)  # If named, look up in `utilities.locations`.
             if isinstance(dest, str)
-            else dest
+            else Point(dest[0], dest[1])
         )
-        dest = Point(dest[0], dest[1])
         path = self.get_api_walk_path(p1=self.loc, p2=dest, host=host)
         return self.walk(path, dest)
 
@@ -284,9 +394,17 @@ class Walker:
         Returns:
             WalkPath: The shortest valid path between the two provided points.
         """
+        key = (p1, p2, host)
+        if key in self._path_cache:
+            self._path_cache.move_to_end(key)
+            return self._path_cache[key]
         api = Pathfinder.get_path_dax if host == "dax" else Pathfinder.get_path_osrspf
         if path_raw := api(p1, p2):
-            return self.add_waypoints(path_raw)
+            path = self.add_waypoints(path_raw)
+            self._path_cache[key] = path
+            if len(self._path_cache) > self.PATH_CACHE_SIZE:
+                self._path_cache.popitem(last=False)
+            return path
         host_name = "DAX" if host == "dax" else "OSRSPathfinder"
         msg = f"{host_name} API request for shortest path failed ({p1} -> {p2})."
         self.bot.log_msg(msg)
@@ -303,7 +421,7 @@ class Walker:
         Returns:
             float: The absolute distance between the two provided `Point` objects.
         """
-        return math.sqrt((p2.x - p1.x) ** 2 + (p2.y - p1.y) ** 2)
+        return math.hypot(p2.x - p1.x, p2.y - p1.y)
 
     def add_waypoints(self, walk_path: WalkPath) -> WalkPath:
         """Smooth a `WalkPath` by computing intermediary `Point` objects between steps.
@@ -317,24 +435,12 @@ class Walker:
                 intermediary `Point` objects interspersed throughout. Note that the
                 relative ordering of the points provided in `walk_path` is maintained.
         """
-        walk_path_w_waypoints = [walk_path[0]]  # Start with the first coordinate.
-        for step in range(len(walk_path) - 1):  # Note that we stop before the last one.
-            p1 = walk_path[step]
-            p2 = walk_path[step + 1]
-            dist = self.distance(p1, p2)
-            # If the next point is far, add intermediary waypoints in between.
-            if dist > self.MAX_WAYPOINT_DIST:  # Measured in tile space.
-                num_waypoints = math.ceil(dist / 10)
-                dx = (p2.x - p1.x) / num_waypoints
-                dy = (p2.y - p1.y) / num_waypoints
-                for i in range(1, num_waypoints):
-                    walk_path_w_waypoints.append(
-                        Point(round(p1.x + i * dx), round(p1.y + i * dy))
-                    )
-            # Cap off the intermediary waypoints with the original point that was
-            # further than 10 tiles away.
-            walk_path_w_waypoints.append(p2)
-        return walk_path_w_waypoints
+        if not walk_path:
+            return []
+        xs, ys = _interpolate_waypoints(
+            *self._to_soa(walk_path), self.MAX_WAYPOINT_DIST
+        )
+        return [Point(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
 
     def travel_to_dest_along_path(
         self, tile_coord: Tuple[int], walk_path: WalkPath, dest_name: str
@@ -0,0 +1,111 @@
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable
+
+import customtkinter as ctk
+from PIL import Image, ImageTk
+
+PATH_SRC = Path(__file__).parents[1]
+PATH_IMG = PATH_SRC / "img"
+PATH_UI = PATH_IMG / "ui"
+
+# Icons requested by `preload_icons` have their PNGs decoded on these workers, leaving
+# only the cheap resize and the image creation, which Tk requires, to the main thread.
+_DECODE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="icon_decode")
+_PRELOADS: Dict[str, "Future[Image.Image]"] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_base_icon(filename: str) -> Image.Image:
+    """Decode a UI icon's PNG once, keeping the full-size image in memory.
+
+    Args:
+        filename (str): The icon's filename within the UI image folder.
+
+    Returns:
+        Image.Image: The decoded icon, in RGBA mode.
+    """
+    with Image.open(PATH_UI / filename) as img:
+        return img.convert("RGBA")  # `convert` loads the pixel data into a copy.
+
+
+def _resize_icon(filename: str, size: int) -> Image.Image:
+    """Resize a decoded UI icon to a square of the given size.
+
+    Icons are small, so bilinear resampling (which Pillow widens to cover the whole
+    source area when downscaling) looks the same as LANCZOS here at a fraction of the
+    cost. Icons already at the requested size are not resampled at all.
+
+    Args:
+        filename (str): The icon's filename within the UI image folder.
+        size (int): The width and height to resize the icon to, in pixels.
+
+    Returns:
+        Image.Image: The resized icon.
+    """
+    img = _wait_for_base_icon(filename)
+    if img.size == (size, size):
+        return img
+    return img.resize((size, size), Image.Resampling.BILINEAR)
+
+
+def _wait_for_base_icon(filename: str) -> Image.Image:
+    """Return a decoded UI icon, waiting for its preload to finish if it has one.
+
+    Args:
+        filename (str): The icon's filename within the UI image folder.
+
+    Returns:
+        Image.Image: The decoded icon, in RGBA mode.
+    """
+    future = _PRELOADS.pop(filename, None)
+    return future.result() if future else _load_base_icon(filename)
+
+
+def preload_icons(filenames: Iterable[str]) -> None:
+    """Start decoding icons in the background, ahead of `load_icon`/`load_ctk_icon`.
+
+    Args:
+        filenames (Iterable[str]): The icons' filenames within the UI image folder.
+    """
+    for filename in filenames:
+        if filename not in _PRELOADS:
+            _PRELOADS[filename] = _DECODE_EXECUTOR.submit(_load_base_icon, filename)
+
+
+@functools.lru_cache(maxsize=64)
+def load_icon(filename: str, size: int) -> ImageTk.PhotoImage:
+    """Load and resize a square UI icon once, sharing it across every view.
+
+    Tk images belong to the interpreter rather than to any one widget, so a single
+    `PhotoImage` can back the buttons of any number of frames and windows. Note that a
+    Tk root window must exist before an icon is first loaded.
+
+    Args:
+        filename (str): The icon's filename within the UI image folder (e.g.
+            "play.png").
+        size (int): The width and height to resize the icon to, in pixels.
+
+    Returns:
+        ImageTk.PhotoImage: The resized icon.
+    """
+    return ImageTk.PhotoImage(_resize_icon(filename, size))
+
+
+@functools.lru_cache(maxsize=64)
+def load_ctk_icon(filename: str, size: int) -> ctk.CTkImage:
+    """Load a square UI icon as a `CTkImage`, sharing it across every view.
+
+    Unlike a `PhotoImage`, a `CTkImage` is rescaled by customtkinter to match the
+    window's DPI scaling, so it is given the full-size icon to resize from.
+
+    Args:
+        filename (str): The icon's filename within the UI image folder (e.g.
+            "submit.png").
+        size (int): The icon's width and height before DPI scaling, in pixels.
+
+    Returns:
+        ctk.CTkImage: The icon.
+    """
+    return ctk.CTkImage(light_image=_wait_for_base_icon(filename), size=(size, size))
@@ -1,14 +1,16 @@
-import threading
+import functools
 import tkinter
 import tkinter as tk
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional
 
 import customtkinter as ctk
-from PIL import Image, ImageTk
 
 from utilities import settings
 from utilities.sprite_scraper import SpriteScraper
+from views._icon_cache import load_icon
 from views.fonts import fonts as fnt
 
 SCRAPER = SpriteScraper()
@@ -21,6 +23,10 @@ DEFAULT_GRAY = ("gray50", "gray30")  # 50% white (50% black) and 30% white (70%
 COLOR_HOVER = "#203a4f"  # Dark, muted blue.
 IMG_SIZE = 24
 
+# Authentication runs off the UI thread so the UI stays responsive. A single reused
+# worker avoids creating a new thread on every submission.
+_AUTH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="auth")
+
 
 class AuthView(ctk.CTkFrame):
     """A UI for the sprite scraper utility which scrapes online PNG item sprites."""
@@ -36,6 +42,9 @@ class AuthView(ctk.CTkFrame):
         self.on_success_callback = on_success_callback
         self.parent.protocol("WM_DELETE_WINDOW", self.__on_closing)
         self.parent.resizable(False, False)
+        # Log messages are queued and written to the log together every 50ms.
+        self._log_queue = deque()
+        self._log_flush_scheduled = False
 
         self._setup_grid()
         self._create_title_text()
@@ -82,13 +91,12 @@ class AuthView(ctk.CTkFrame):
             corner_radius=0,
         )
         self.entry_sub_key.grid(row=2, column=0, sticky="esw", padx=0, pady=0)
+        # Whether the entry field currently shows our own grayed-out placeholder text.
+        self._is_placeholder = False
 
     def _create_submit_button(self) -> None:
         """Create a button to submit subscription keys for authentication."""
-        self.img_submit = ImageTk.PhotoImage(
-            Image.open(PATH_UI / "submit.png").resize((IMG_SIZE, IMG_SIZE)),
-            Image.LANCZOS,
-        )
+        self.img_submit = load_icon("submit.png", IMG_SIZE)
         self.btn_submit = ctk.CTkButton(
             self,
             text="Submit",
@@ -118,6 +126,10 @@ class AuthView(ctk.CTkFrame):
         )
         self.txt_log.grid(row=1, column=0, sticky="nsew", padx=0, pady=0)
         self.txt_log.configure(state=tkinter.DISABLED)
+        # Mark where the latest log message starts. Left gravity keeps the mark before
+        # text inserted at it.
+        self.txt_log.mark_set("lastmsg", "end-1c")
+        self.txt_log.mark_gravity("lastmsg", "left")
         self.log_frame.grid(row=4, column=0, sticky="nsew", padx=13, pady=13)
 
     # --- Handlers ---
@@ -125,11 +137,13 @@ class AuthView(ctk.CTkFrame):
         """Handle the event where the auth window is closed (e.g. clicking X)."""
         self.parent.destroy()
 
-    def _start_countdown(self, count: int) -> None:
+    def _start_countdown(self, count: int, overwrite: bool = False) -> None:
         """Start a countdown for closing the auth window, updating the log each second.
 
         Args:
             countdown (int): The number of seconds remaining in the countdown.
+            overwrite (bool): Whether to overwrite the previous log message with the
+                countdown message. Defaults to False.
         """
         if count > 0:
             msg = (
@@ -137,9 +151,9 @@ class AuthView(ctk.CTkFrame):
                 " next time RuneDark starts. Restart RuneDark to apply this change."
                 f"\nWindow will close automatically in {count} seconds."
             )
-            self.__update_log(msg, overwrite=True)
+            self.__update_log(msg, overwrite=overwrite)
             # Schedule the next countdown update after 1 second
-            self.after(1000, lambda: self._start_countdown(count - 1))
+            self.after(1000, lambda: self._start_countdown(count - 1, overwrite=True))
         else:
             # When countdown reaches 0, close the window and trigger the callback
             self.__update_log("Closing now...", overwrite=True)
@@ -148,45 +162,6 @@ class AuthView(ctk.CTkFrame):
     def __on_submit(self) -> None:
         """Handle the event where a subscription key is submitted."""
         subscription_key = self.entry_sub_key.get()
-        thread = threading.Thread(
-            target=self._submit_and_authenticate,
-            kwargs={
-                "subscription_key": subscription_key,
-                "notify_callback": self.__update_log,
-            },
-            daemon=True,
-        )
-
-        def __on_auth_result(self, success: bool) -> None:
-            """Callback to handle the result of the authentication.
-
-            Args:
-                success (bool): A boolean indicating whether the authentication was
-                    successful. True if authenticated, False otherwise.
-            """
-            if success and self.on_success_callback:
-                settings.set("subscription_key", subscription_key)
-                self._start_countdown(3)
-                self.on_success_callback()  # Trigger the callback in TitleView.
-                self.parent.after(3000, self.parent.destroy)
-
-        def __threaded_auth() -> None:
-            """Run the authentication process in a separate thread.
-
-            This method executes the auth process without blocking the UI and passes
-            the result to `__on_auth_result` on the main thread using
-            `self.parent.after`. The threaded process keeps the UI responsive if
-            authentication takes a few seconds.
-            """
-            result = self._submit_and_authenticate(
-                subscription_key=subscription_key,
-                notify_callback=self.__update_log,
-            )
-            # Call the callback on the main thread. Delay 500ms for user reading time.
-            self.parent.after(500, lambda: __on_auth_result(self, result))
-
-        # Start the authentication in a new thread.
-        thread = threading.Thread(target=__threaded_auth, daemon=True)
         self.__set_default_placeholder_text()
         self.entry_sub_key.bind("<FocusIn>", self.__clear_placeholder_text)
         self.entry_sub_key.bind("<FocusOut>", self.__add_placeholder_text)
@@ -195,7 +170,57 @@ class AuthView(ctk.CTkFrame):
         # tkinter and customtkinter use 0-indexing for chars but 1-indexing for lines.
         # self.txt_log.delete("1.0", "end")  # Delete the previous line on update.
         self.txt_log.configure(state=tkinter.DISABLED)
-        thread.start()
+        # Authenticate on the worker thread, then pass the result to `__on_auth_result`
+        # on the main thread using `self.parent.after`. Delay 500ms for user reading
+        # time.
+        future = _AUTH_EXECUTOR.submit(
+            self._submit_and_authenticate,
+            subscription_key=subscription_key,
+            notify_callback=self.__update_log,
+        )
+        future.add_done_callback(
+            functools.partial(self.__on_auth_done, subscription_key)
+        )
+
+    def __on_auth_done(self, subscription_key: str, future: Future) -> None:
+        """Pass a finished authentication's result to the main thread.
+
+        If the authentication raised, it is reported to the main thread as a failure,
+        since an exception raised here would be swallowed by the executor.
+
+        Args:
+            subscription_key (str): The subscription key that was submitted.
+            future (Future): The finished authentication task.
+        """
+        try:
+            success = future.result()
+        except Exception as e:
+            self.parent.after(0, self.__on_auth_result, subscription_key, False, e)
+            return
+        self.parent.after(500, self.__on_auth_result, subscription_key, success)
+
+    def __on_auth_result(
+        self,
+        subscription_key: str,
+        success: bool,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Callback to handle the result of the authentication.
+
+        Args:
+            subscription_key (str): The subscription key that was submitted.
+            success (bool): A boolean indicating whether the authentication was
+                successful. True if authenticated, False otherwise.
+            error (Optional[Exception], optional): The exception raised while
+                authenticating, if any. Defaults to None.
+        """
+        if error is not None:
+            self.__update_log(f"Authentication failed: {error}")
+        if success and self.on_success_callback:
+            settings.set("subscription_key", subscription_key)
+            self._start_countdown(3)
+            self.on_success_callback()  # Trigger the callback in TitleView.
+            self.parent.after(3000, self.parent.destroy)
 
     def _submit_and_authenticate(self, subscription_key: str, **kwargs) -> bool:
         """Submit a RuneDark subscription key for authentication.
@@ -214,7 +239,7 @@ class AuthView(ctk.CTkFrame):
         if subscription_key != "osbc":
             notify_callback("Authentication failed.")
             return False
-        notify_callback("Authentication successful.\n\n")  # Prevent overwrite.
+        notify_callback("Authentication successful.\n")
         return True
 
     def __set_default_placeholder_text(self) -> None:
@@ -226,22 +251,24 @@ class AuthView(ctk.CTkFrame):
         self.entry_sub_key.delete(0, "end")
         self.entry_sub_key.insert(0, " Enter your subscription key.")
         self.entry_sub_key.configure(text_color="grey")
+        self._is_placeholder = True
 
     def __clear_placeholder_text(self, event: tk.Event) -> None:
         """Clear the placeholder text when the entry field gains focus.
 
-        This method is triggered when the entry field is clicked or focused. It checks
-        if the current content is the default placeholder text. If so, it clears the
-        entry field to allow user input.
+        This method is triggered when the entry field is clicked or focused. If the
+        entry field is showing the default placeholder text, it is cleared to allow
+        user input.
 
         Args:
             event (tk.Event): The event triggered when the entry field gains focus.
                 While it is not used directly in this function, it is required by
                 the binding.
         """
-        if self.entry_sub_key.get() == " Enter your subscription key.":
+        if self._is_placeholder:
             self.entry_sub_key.delete(0, "end")
             self.entry_sub_key.configure(text_color="white")
+            self._is_placeholder = False
 
     def __add_placeholder_text(self, event: tk.Event) -> None:
         """Restore the placeholder text if the entry field is left empty.
@@ -258,19 +285,36 @@ class AuthView(ctk.CTkFrame):
             self.__set_default_placeholder_text()
 
     def __update_log(self, text: str, overwrite: bool = False) -> None:
-        """Update the console log with the given text.
+        """Queue the given text to be written to the console log.
 
-        Note that `tkinter` and `customtkinter` use 0-indexing for chars but 1-indexing
-        for lines.
+        Queued messages are written together on the next flush, scheduled 50ms after
+        the first message queued since the last flush.
 
         Args:
             text (str): The desired text to append to the log.
-            overwrite (bool): Whether to overwrite the previous line with the new one.
-                Defaults to False.
+            overwrite (bool): Whether to overwrite the previous message with the new
+                one. Defaults to False.
+        """
+        self._log_queue.append((text, overwrite))
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after(50, self.__flush_log)
+
+    def __flush_log(self) -> None:
+        """Write all queued messages to the console log in a single edit.
+
+        The "lastmsg" mark sits just before the most recent message, so overwriting it
+        deletes from the mark rather than counting lines back from the end.
         """
+        self._log_flush_scheduled = False
+        if not self.txt_log.winfo_exists():  # The window may have closed meanwhile.
+            return
         self.txt_log.configure(state=tkinter.NORMAL)
-        if overwrite:
-            self.txt_log.delete("end-2l", "end")
-        self.txt_log.insert("end", "\n" + text)
+        while self._log_queue:
+            text, overwrite = self._log_queue.popleft()
+            if overwrite:
+                self.txt_log.delete("lastmsg", "end-1c")
+            self.txt_log.mark_set("lastmsg", "end-1c")
+            self.txt_log.insert("end", "\n" + text)
         self.txt_log.configure(state=tkinter.DISABLED)
         self.txt_log.see(tkinter.END)
@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, Callable
 
 import customtkinter as ctk
 
@@ -8,6 +10,8 @@ from views.output_log_frame import OutputLogFrame
 if TYPE_CHECKING:
     from controller.bot_controller import BotController
 
+UI_POLL_MS = 16  # How long queued UI updates wait to be applied, in milliseconds.
+
 
 class BotView(ctk.CTkFrame):
     """A custom frame that displays the main interface for a given `Bot`.
@@ -50,6 +54,13 @@ class BotView(ctk.CTkFrame):
 
         self.controller = None
 
+        # Bots run in worker threads, so their UI updates are queued and then applied
+        # in batches on the UI thread. A drain is only scheduled while updates are
+        # waiting, so an idle view doesn't wake up the UI thread.
+        self._ui_queue = queue.SimpleQueue()
+        self._ui_lock = threading.Lock()
+        self._drain_scheduled = False  # Whether a drain of `_ui_queue` is pending.
+
     def set_controller(self, controller: "BotController") -> None:
         """Assign the provided `BotController` to the `BotView` and its child frames.
 
@@ -64,3 +75,43 @@ class BotView(ctk.CTkFrame):
         self.controller = controller
         self.frame_info.set_controller(controller=controller)
         self.frame_output_log.set_controller(controller=controller)
+
+    def post(self, func: Callable[..., Any], *args: Any) -> None:
+        """Queue a UI update to be run on the UI thread.
+
+        Note that this method is safe to call from any thread. Updates run in the order
+        they were posted.
+
+        Args:
+            func (Callable[..., Any]): The view method to call.
+            *args (Any): The arguments to call `func` with.
+        """
+        self._ui_queue.put((func, args))
+        self.__schedule_drain()
+
+    def __schedule_drain(self) -> None:
+        """Schedule a drain of the UI update queue, unless one is already pending."""
+        with self._ui_lock:
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        self.after(UI_POLL_MS, self.__drain_ui_queue)
+
+    def __drain_ui_queue(self) -> None:
+        """Apply every queued UI update.
+
+        Updates posted while draining are either applied by this drain or schedule the
+        next one. If an update raises, the rest are left for another drain.
+        """
+        with self._ui_lock:
+            self._drain_scheduled = False
+        try:
+            while True:
+                try:
+                    func, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                func(*args)
+        finally:
+            if not self._ui_queue.empty():
+                self.__schedule_drain()
@@ -1,6 +1,8 @@
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from tkinter import IntVar
-from typing import Callable
+from typing import Callable, Dict, Optional, Tuple
 
 import customtkinter as ctk
 import cv2
@@ -8,6 +10,7 @@ import numpy as np
 from PIL import Image, ImageOps, ImageTk
 
 from utilities.img_search import BOT_IMAGES
+from views._icon_cache import load_icon
 from views.fonts import fonts as fnt
 
 PATH_SRC = Path(__file__).parents[1]
@@ -17,6 +20,59 @@ PATH_SCREENSHOTTER = BOT_IMAGES / "screenshotter"
 SPLASH_FILENAME = "rgb-hsv.png"
 IMG_SIZE = 24
 PADX_SLIDER = 10
+# The screenshot analyzed for each screen region radio button.
+_REGION_FILES = {
+    "minimap": "screenshotter-minimap.png",
+    "game_view": "screenshotter-game-view.png",
+    "control_panel": "screenshotter-control-panel.png",
+}
+
+
+# Decodes the start-up screenshot so the Tk main loop isn't blocked while it loads.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="color_filter")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_pil_image(image_name: str) -> Image.Image:
+    """Decode a screenshot into a PIL `Image.Image` once per process.
+
+    Args:
+        image_name (str): The string name of the image (including extension).
+
+    Returns:
+        Image.Image: The decoded screenshot. Callers must not modify it in place.
+    """
+    with Image.open(str(PATH_SCREENSHOTTER / image_name)) as img:
+        return img.copy()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_bgr_image(
+    image_name: str, max_size: Optional[Tuple[int, int]] = None
+) -> np.ndarray:
+    """Decode a screenshot into an OpenCV BGR `np.ndarray` once per process.
+
+    Args:
+        image_name (str): The string name of the image (including extension).
+        max_size (Tuple[int, int], optional): The (width, height) box to shrink the
+            screenshot into, preserving its aspect ratio like `ImageOps.contain`.
+            Screenshots that already fit are not enlarged. Defaults to None.
+
+    Returns:
+        np.ndarray: The decoded screenshot. Callers must not modify it in place.
+    """
+    img = cv2.imread(str(PATH_SCREENSHOTTER / image_name))
+    if max_size is None:
+        return img
+    height, width = img.shape[:2]
+    if width <= max_size[0] and height <= max_size[1]:
+        return img
+    # Match `ImageOps.contain`, which fits the limiting side and rounds the other.
+    if width / height > max_size[0] / max_size[1]:
+        size = (max_size[0], round(height / width * max_size[0]))
+    else:
+        size = (round(width / height * max_size[1]), max_size[1])
+    return cv2.resize(img, size, interpolation=cv2.INTER_AREA)
 
 
 class ColorFilterView(ctk.CTkFrame):
@@ -25,8 +81,9 @@ class ColorFilterView(ctk.CTkFrame):
     H_minval, S_minval, V_minval = 0, 0, 0
     H_maxval, S_maxval, V_maxval = 179, 255, 255
 
-    # These flags indicate which screenshot is currently being analyzed.
-    minimap, game_view, control_panel = False, False, False
+    # The screen region (a key of `_REGION_FILES`) whose screenshot is currently being
+    # analyzed, or None for the splash image.
+    _current_region: Optional[str] = None
 
     image_to_load = None
     __start_up = True  # Whether the Color Filter was just freshly started.
@@ -42,7 +99,27 @@ class ColorFilterView(ctk.CTkFrame):
         super().__init__(parent)
         self.parent = parent
         self.parent.resizable(False, False)
-        self.parent.protocol("WM_DELETE_WINDOW", self.__on_closing)
+        self.parent.protocol("WM_DELETE_WINDOW", self.hide)  # Hide it for reuse.
+        self._pending_render = None  # The `after` ID of the next scheduled re-render.
+        # Each font preset is created once and shared by every widget that uses it.
+        self._font_title = fnt.title_font()
+        self._font_heading = fnt.heading_font_normal()
+        self._font_body_large = fnt.body_large_font()
+        self._font_body_med = fnt.body_med_font()
+        # HSV and RGB conversions of each screenshot, keyed by filename. The
+        # screenshots are never modified, so each entry stays valid for the life of
+        # the view.
+        self._conversion_cache: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._hsv_current = None
+        self._rgb_current = None
+        # Output buffers for the HSV filter, reallocated only when the image size does.
+        self._mask_buf = None
+        self._rgb_buf = None
+        self._lo = np.zeros(3, dtype=np.uint8)  # The minimum HSV values to keep.
+        self._hi = np.zeros(3, dtype=np.uint8)  # The maximum HSV values to keep.
+        # The filtered image's `PhotoImage`, pasted into in place while its size holds.
+        self._mask_photo = None
+        self.image_to_display = None
         self._setup_grid()
         self._create_title_label()
         self._create_hsv_frame()
@@ -51,6 +128,8 @@ class ColorFilterView(ctk.CTkFrame):
         self._create_slider_controls()
         self._create_color_profile_text_entry()
         self._create_save_button()
+        # Once the view is built, load the screenshot and then the filtered image.
+        self.after_idle(self.__import_screenshot_async)
 
     # --- Color Filter UI Creation Steps ---
     def _setup_grid(self) -> None:
@@ -65,7 +144,7 @@ class ColorFilterView(ctk.CTkFrame):
         self.search_label = ctk.CTkLabel(
             master=self,
             text="Create custom HSV color filters for in-game objects.",
-            font=fnt.title_font(),
+            font=self._font_title,
             wraplength=900,
             height=64,
         )
@@ -107,14 +186,19 @@ class ColorFilterView(ctk.CTkFrame):
         self.screenshot_frame = self._create_frame(
             self.images_frame, row=0, col=0, sticky="n"
         )
-        self.after(
-            100, self.__import_screenshot
-        )  # Load screenshot after a short delay.
+        # This label (which only has an image and no text) is reused for every update.
+        self.screenshot_label = ctk.CTkLabel(
+            master=self.screenshot_frame, text="", font=self._font_body_large
+        )
+        self.screenshot_label.grid(row=0, column=0, sticky="ew")
         # Create the mask frame.
         self.mask_frame = self._create_frame(
             self.images_frame, row=1, col=0, sticky="s"
         )
-        self.after(100, self.__update_image)  # Resize/update screenshot after delay.
+        self.mask_label = ctk.CTkLabel(
+            master=self.mask_frame, text="", font=self._font_body_large
+        )
+        self.mask_label.grid(row=1, column=0, sticky="nsew")
 
     def _create_radiobutton_frame(self) -> None:
         """Create a sub-frame of three checkable radio buttons."""
@@ -133,7 +217,7 @@ class ColorFilterView(ctk.CTkFrame):
         ctk.CTkLabel(
             master=self.radiobutton_frame,
             text="Select Screen Region",
-            font=fnt.heading_font_normal(),
+            font=self._font_heading,
         ).grid(row=0, column=0, columnspan=3, padx=PADX_SLIDER, pady=(0, 20))
 
         # Create and pack each checkbox.
@@ -176,48 +260,42 @@ class ColorFilterView(ctk.CTkFrame):
             master=self.slider_controls_frame,
             label="H-min",
             max_value=179,
-            callback=self.__on_slider_event_Hmin,
-            value=self.H_minval,
+            attr="H_minval",
             row=0,
         )
         self.lbl_S_minval = self._create_slider(
             master=self.slider_controls_frame,
             label="S-min",
             max_value=255,
-            callback=self.__on_slider_event_Smin,
-            value=self.S_minval,
+            attr="S_minval",
             row=3,
         )
         self.lbl_V_minval = self._create_slider(
             master=self.slider_controls_frame,
             label="V-min",
             max_value=255,
-            callback=self.__on_slider_event_Vmin,
-            value=self.V_minval,
+            attr="V_minval",
             row=6,
         )
         self.lbl_H_maxval = self._create_slider(
             master=self.slider_controls_frame,
             label="H-max",
             max_value=179,
-            callback=self.__on_slider_event_Hmax,
-            value=self.H_maxval,
+            attr="H_maxval",
             row=9,
         )
         self.lbl_S_maxval = self._create_slider(
             master=self.slider_controls_frame,
             label="S-max",
             max_value=255,
-            callback=self.__on_slider_event_Smax,
-            value=self.S_maxval,
+            attr="S_maxval",
             row=12,
         )
         self.lbl_V_maxval = self._create_slider(
             master=self.slider_controls_frame,
             label="V-max",
             max_value=255,
-            callback=self.__on_slider_event_Vmax,
-            value=self.V_maxval,
+            attr="V_maxval",
             row=15,
         )
 
@@ -227,16 +305,13 @@ class ColorFilterView(ctk.CTkFrame):
             master=self.hsv_frame,
             placeholder_text=" Enter color profile name (e.g. default_cyan).",
             corner_radius=0,
-            font=fnt.body_large_font(),
+            font=self._font_body_large,
         )
         self.enter_color_name.grid(row=2, column=0, sticky="swe", pady=(30, 0))
 
     def _create_save_button(self) -> None:
         """Create the Save Color Profile button."""
-        self.img_save = ImageTk.PhotoImage(
-            Image.open(str(PATH_UI / "save.png")).resize((IMG_SIZE, IMG_SIZE)),
-            Image.Resampling.LANCZOS,
-        )
+        self.img_save = load_icon("save.png", IMG_SIZE)
         self.save_color_button = ctk.CTkButton(
             master=self.hsv_frame,
             height=64,
@@ -245,7 +320,7 @@ class ColorFilterView(ctk.CTkFrame):
             text="Save Color Profile",
             command=self.__on_save_color_profile,
             corner_radius=0,
-            font=fnt.body_large_font(),
+            font=self._font_body_large,
         )
         self.save_color_button.grid(row=3, column=0, sticky="swe")
 
@@ -301,8 +376,7 @@ class ColorFilterView(ctk.CTkFrame):
         master: ctk.CTkFrame,
         label: str,
         max_value: int,
-        callback: Callable,
-        value: int,
+        attr: str,
         row: int,
     ) -> ctk.CTkLabel:
         """Create and return a labeled slider placed at a specific of grid location.
@@ -318,22 +392,23 @@ class ColorFilterView(ctk.CTkFrame):
                 will be created.
             label (str): The label for the slider.
             max_value (int): The maximum value of the slider.
-            callback (Callable): The function to be executed when the slider is moved.
-            value (int): The initial value of the slider.
+            attr (str): The name of the HSV value the slider sets (e.g. "H_minval"). Its
+                current value is the initial value of the slider.
             row (int): The grid row number to place the slider and its components.
 
         Returns:
-            ctk.CTkLabel: The label displaying the current value of the slider. This is
-                returned so it can be dynamically updated via the `callback`.
+            ctk.CTkLabel: The label displaying the current value of the slider, which is
+                updated whenever the slider is moved.
         """
-        ctk.CTkLabel(master=master, text=label, font=fnt.body_large_font()).grid(
+        value = getattr(self, attr)
+        ctk.CTkLabel(master=master, text=label, font=self._font_body_large).grid(
             row=row,
             column=0,
             sticky="wne",
             padx=PADX_SLIDER,
             pady=1,
         )  # The label of the slider.
-        lbl_val = ctk.CTkLabel(master=master, text=value, font=fnt.body_med_font())
+        lbl_val = ctk.CTkLabel(master=master, text=value, font=self._font_body_med)
         lbl_val.grid(
             row=row + 1,
             column=0,
@@ -347,7 +422,7 @@ class ColorFilterView(ctk.CTkFrame):
             from_=0,
             to=max_value,
             number_of_steps=max_value,
-            command=callback,
+            command=functools.partial(self.__on_slider_event, attr, lbl_val),
         )
         slider.grid(
             row=row + 2,
@@ -362,13 +437,34 @@ class ColorFilterView(ctk.CTkFrame):
     # --- Screenshot Load and Update ---
     def __import_screenshot(self) -> None:
         """Import the appropriate screenshot per the selected radio button."""
-        conditions = {
-            self.minimap: "screenshotter-minimap.png",
-            self.game_view: "screenshotter-game-view.png",
-            self.control_panel: "screenshotter-control-panel.png",
-        }
-        self.screenshot = self.__load_pil_image(conditions.get(True, SPLASH_FILENAME))
+        self.screenshot = self.__load_pil_image(
+            _REGION_FILES.get(self._current_region, SPLASH_FILENAME)
+        )
+        self.__update_screenshot(self.screenshot)
+
+    def __import_screenshot_async(self) -> None:
+        """Decode the start-up screenshot on a worker thread, then display it."""
+        # Warm the OpenCV copy first; the single worker finishes it before the PIL one.
+        # Pass the same positional arguments as `__update_image`, since `lru_cache`
+        # keys `f(a)` and `f(a, None)` separately.
+        _IO_EXECUTOR.submit(_load_bgr_image, SPLASH_FILENAME, None)
+        future = _IO_EXECUTOR.submit(_load_pil_image, SPLASH_FILENAME)
+        future.add_done_callback(
+            lambda f: self.after(0, self.__on_screenshot_loaded, f)
+        )
+
+    def __on_screenshot_loaded(self, future: Future) -> None:
+        """Display the start-up screenshot once it has been decoded.
+
+        Args:
+            future (Future): The finished task that decoded the screenshot.
+        """
+        # Skip it if the view was closed or a region was selected in the meantime.
+        if not self.winfo_exists() or not self.__start_up:
+            return
+        self.screenshot = future.result()
         self.__update_screenshot(self.screenshot)
+        self.__update_image()
 
     def __load_pil_image(self, image_name: str) -> Image.Image:
         """Load a PIL `Image.Image` given an screenshot name.
@@ -379,8 +475,7 @@ class ColorFilterView(ctk.CTkFrame):
         Returns:
             Image: The screenshot as an `Image.Image` object.
         """
-        img_path = PATH_SCREENSHOTTER / image_name
-        return Image.open(str(img_path))
+        return _load_pil_image(image_name)
 
     def __update_screenshot(self, img: Image.Image) -> None:
         """Update an old screenshot with a new one.
@@ -389,120 +484,134 @@ class ColorFilterView(ctk.CTkFrame):
             img (Image.Image): The new screenshot to replace the old.
         """
         # Resize the top-half static image. Note the full panel is 535 wide x 670 tall.
-        if self.game_view or self.control_panel:
+        if self._current_region in ("game_view", "control_panel"):
             img = ImageOps.contain(img, (515, 335))
+        # Keep a reference to the `PhotoImage` so it isn't garbage collected.
         self.screenshot_tk = ImageTk.PhotoImage(img)
-
-        # Remove the previous screenshot label from the `self.screenshot_frame`.
-        for child in self.screenshot_frame.winfo_children():
-            child.destroy()
-
-        # Put the new label (which only has an image and no text) on the grid.
-        ctk.CTkLabel(
-            master=self.screenshot_frame,
-            image=self.screenshot_tk,
-            text="",
-            font=fnt.body_large_font(),
-        ).grid(row=0, column=0, sticky="ew")
+        self.screenshot_label.configure(image=self.screenshot_tk)
 
     def __update_image(self) -> None:
         """Update a given screenshot after an HSV color filter is applied."""
         # Use the image data already in memory if the image has been loaded previously.
-        if isinstance(self.image_to_load, np.ndarray):
-            img = self.image_to_load
-        if not isinstance(self.image_to_load, np.ndarray) and not self.image_to_load:
+        if not isinstance(self.image_to_load, np.ndarray):
             # If the image is empty, load the image from the hard drive.
-            conditions = {
-                self.minimap: "screenshotter-minimap.png",
-                self.game_view: "screenshotter-game-view.png",
-                self.control_panel: "screenshotter-control-panel.png",
-            }
-            screenshot_filename = conditions.get(True, SPLASH_FILENAME)
-            img_path = PATH_SCREENSHOTTER / screenshot_filename
-            img = cv2.imread(str(img_path))  # Returns `np.ndarray`, not `Image.Image`.
-            self.image_to_load = img
-
-        # Set minimum and maximum HSV display values.
-        lo = np.array([self.H_minval, self.S_minval, self.V_minval])
-        hi = np.array([self.H_maxval, self.S_maxval, self.V_maxval])
-
-        # Convert to HSV format and color threshold.
-        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
-        mask = cv2.inRange(hsv, lo, hi)
-        result = cv2.bitwise_and(img, img, mask=mask)
-
-        # Convert the OpenCV image to a PIL image.
-        image_rgb = cv2.cvtColor(result, cv2.COLOR_BGR2RGB)
-        pil_image = Image.fromarray(image_rgb)
+            screenshot_filename = _REGION_FILES.get(
+                self._current_region, SPLASH_FILENAME
+            )
+            # Returns `np.ndarray`, not `Image.Image`. The Game View screenshot is
+            # shrunk to its display size up front so fewer pixels get filtered.
+            self.image_to_load = _load_bgr_image(
+                screenshot_filename,
+                (515, 335) if self._current_region == "game_view" else None,
+            )
+            # Convert to HSV and RGB formats only when the source image changes.
+            if screenshot_filename not in self._conversion_cache:
+                self._conversion_cache[screenshot_filename] = (
+                    cv2.cvtColor(self.image_to_load, cv2.COLOR_BGR2HSV),
+                    cv2.cvtColor(self.image_to_load, cv2.COLOR_BGR2RGB),
+                )
+            self._hsv_current, self._rgb_current = self._conversion_cache[
+                screenshot_filename
+            ]
+
+        hsv_range = (
+            (self.H_minval, self.S_minval, self.V_minval),
+            (self.H_maxval, self.S_maxval, self.V_maxval),
+        )
+        if hsv_range == ((0, 0, 0), (179, 255, 255)):
+            # Every pixel passes the full HSV range, so there is nothing to filter.
+            image_rgb = self._rgb_current
+        else:
+            # Set minimum and maximum HSV display values.
+            self._lo[:] = hsv_range[0]
+            self._hi[:] = hsv_range[1]
+
+            # Color threshold the cached HSV image into the preallocated buffers.
+            self.__ensure_buffers(self._rgb_current.shape)
+            cv2.inRange(self._hsv_current, self._lo, self._hi, dst=self._mask_buf)
+
+            # Copy the in-range pixels of the cached RGB image onto a black background.
+            self._rgb_buf.fill(0)  # `copyTo` leaves masked-out pixels untouched.
+            cv2.copyTo(self._rgb_current, self._mask_buf, self._rgb_buf)
+            image_rgb = self._rgb_buf
+
+        # Convert the OpenCV image to a PIL image that shares the RGB buffer.
+        height, width = image_rgb.shape[:2]
+        pil_image = Image.frombuffer(
+            "RGB", (width, height), image_rgb, "raw", "RGB", 0, 1
+        )
 
         # Resize the bottom-half color-filtered image. Dimensions are width x height.
-        if self.minimap:
+        # The Game View (i.e. half-and-half) was already shrunk before filtering.
+        if self._current_region == "minimap":
             pil_image = ImageOps.contain(pil_image, (515, 510))  # Presumed enlarged.
-        if self.game_view:
-            pil_image = ImageOps.contain(pil_image, (515, 335))  # Half-and-half.
 
-        # Create a `PhotoImage` from the resized PIL image
-        self.image_to_display = ImageTk.PhotoImage(pil_image)
+        # Paste the resized PIL image into the existing `PhotoImage` if it fits.
+        photo = self._mask_photo
+        if photo is None or (photo.width(), photo.height()) != pil_image.size:
+            self._mask_photo = ImageTk.PhotoImage(pil_image)
+        else:
+            photo.paste(pil_image)
+        image_to_display = self._mask_photo
         if self.__start_up:
-            self.image_to_display = self.screenshot_tk
+            image_to_display = self.screenshot_tk
             self.__start_up = False
+        # Tk redraws pasted pixels by itself, so only a new `PhotoImage` is configured.
+        if image_to_display is not self.image_to_display:
+            self.image_to_display = image_to_display
+            self.mask_label.configure(image=self.image_to_display)
 
-        # Add the new screenshot label to the screenshot frame.
-        maskshotlabel_new = ctk.CTkLabel(
-            master=self.mask_frame,
-            image=self.image_to_display,
-            text="",
-            font=fnt.body_large_font(),
-        )
-        maskshotlabel_new.grid(row=1, column=0, sticky="nsew")
+    def __ensure_buffers(self, shape: tuple) -> None:
+        """Allocate the HSV filter's output buffers if the image size has changed.
 
-        # Remove previous screenshot label from screenshot frame.
-        for child in reversed(self.mask_frame.winfo_children()):
-            if child != maskshotlabel_new:
-                child.destroy()
+        Args:
+            shape (tuple): The (height, width, channels) shape of the source image.
+        """
+        if self._rgb_buf is not None and self._rgb_buf.shape == shape:
+            return
+        self._mask_buf = np.empty(shape[:2], dtype=np.uint8)
+        self._rgb_buf = np.empty(shape, dtype=np.uint8)
 
-        self.maskshotlabel = maskshotlabel_new
+    def __schedule_update(self) -> None:
+        """Schedule a re-render of the filtered image once Tk is idle.
 
-    # --- Handlers --
-    def __on_closing(self) -> None:
-        """Handle the event where the Color Filter is closed (e.g. clicking X)."""
-        self.parent.destroy()
-
-    def __on_slider_event_Hmin(self, value) -> None:
-        """Handle the event where the H-min Slider is slid left or right."""
-        self.H_minval = int(value)
-        self.lbl_H_minval.configure(text=str(self.H_minval))
-        self.__update_image()
+        Slider events arrive far faster than the HSV filter can be applied. The render
+        reads the slider values when it runs, so while one is already pending, later
+        events are dropped and Tk can process them without waiting on a render.
+        """
+        if self._pending_render is None:
+            self._pending_render = self.after_idle(self.__do_update)
 
-    def __on_slider_event_Hmax(self, value) -> None:
-        """Handle the event where the H-max Slider is slid left or right."""
-        self.H_maxval = int(value)
-        self.lbl_H_maxval.configure(text=str(self.H_maxval))
+    def __do_update(self) -> None:
+        """Run a scheduled re-render of the filtered image."""
+        self._pending_render = None
         self.__update_image()
 
-    def __on_slider_event_Smin(self, value) -> None:
-        """Handle the event where the S-min Slider is slid left or right."""
-        self.S_minval = int(value)
-        self.lbl_S_minval.configure(text=str(self.S_minval))
-        self.__update_image()
+    def show(self) -> None:
+        """Show the Color Filter window again after `hide`."""
+        self.parent.deiconify()
+        self.parent.lift()
 
-    def __on_slider_event_Smax(self, value) -> None:
-        """Handle the event where the S-max Slider is slid left or right."""
-        self.S_maxval = int(value)
-        self.lbl_S_maxval.configure(text=str(self.S_maxval))
-        self.__update_image()
+    def hide(self) -> None:
+        """Hide the Color Filter window for reuse, dropping any pending re-render."""
+        if self._pending_render:
+            self.after_cancel(self._pending_render)
+            self._pending_render = None
+        self.parent.withdraw()
 
-    def __on_slider_event_Vmin(self, value) -> None:
-        """Handle the event where the V-min Slider is slid left or right."""
-        self.V_minval = int(value)
-        self.lbl_V_minval.configure(text=str(self.V_minval))
-        self.__update_image()
+    # --- Handlers --
+    def __on_slider_event(self, attr: str, lbl_val: ctk.CTkLabel, value: float) -> None:
+        """Handle the event where an HSV slider is slid left or right.
 
-    def __on_slider_event_Vmax(self, value) -> None:
-        """Handle the event where the V-max Slider is slid left or right."""
-        self.V_maxval = int(value)
-        self.lbl_V_maxval.configure(text=str(self.V_maxval))
-        self.__update_image()
+        Args:
+            attr (str): The name of the HSV value the slider sets (e.g. "H_minval").
+            lbl_val (ctk.CTkLabel): The label displaying the current slider value.
+            value (float): The new value of the slider.
+        """
+        value = int(value)
+        setattr(self, attr, value)
+        lbl_val.configure(text=str(value))
+        self.__schedule_update()
 
     def __on_save_color_profile(self) -> None:
         """Dynamically update HSV color tuples within `utilities.mappings`."""
@@ -515,40 +624,27 @@ class ColorFilterView(ctk.CTkFrame):
         )
         if not color_name or (len(color_name) > 1 and color_name[0].isdigit()):
             return
-        with open(color_file, "r", encoding="utf8") as file:
-            file.seek(0, 2)  # Move the cursor to the end of the file.
-            file_length = file.tell()  # Number of bytes from beginning to end.
-            if file_length == 0:
-                has_newline = False
-            if file_length != 0:
-                file.seek(file_length - 1)  # Move the cursor to the 2nd-to-last char.
-                last_char = file.read(1)  # Read the last character.
-                has_newline = last_char == "\n"
-            n_ = "\n" if not has_newline else ""
-            file.seek(0)  # Now move the cursor back to the top of the file.
-            lines = []
-            for line in file:  # Read in all lines to potentially replace them.
-                lines.append(line)
-            file.seek(0)
-            replacement = False
-            for i, line in enumerate(lines):
-                if line.startswith(f"{color_name} = "):
-                    lines[i] = color_range
-                    replacement = True
-            if not replacement:
-                lines.append(f"{n_}{color_range}")  # Append if no match is found.
-        # Lastly, overwrite the file with the new lines.
-        with open(color_file, "w", encoding="utf8") as file:
-            for line in lines:
-                file.write(line)
+        # Read the whole file once, then replace or append the profile in memory.
+        text = color_file.read_text(encoding="utf8")
+        lines = text.splitlines(keepends=True)
+        replacement = False
+        for i, line in enumerate(lines):
+            if line.startswith(f"{color_name} = "):
+                lines[i] = color_range
+                replacement = True
+        if not replacement:
+            n_ = "\n" if text and not text.endswith("\n") else ""
+            lines.append(f"{n_}{color_range}")  # Append if no match is found.
+        # Lastly, overwrite the file only if its contents actually changed.
+        new_text = "".join(lines)
+        if new_text != text:
+            color_file.write_text(new_text, encoding="utf8")
 
     # --- Radio Button State Checkers ---
     def __minimap_check(self) -> None:
         """Check whether the Minimap Radio Button is selected or not."""
         if self.minimap_box._check_state:
-            self.minimap = True
-            self.game_view = False
-            self.control_panel = False
+            self._current_region = "minimap"
             self.image_to_load = None
             self.__import_screenshot()
             self.__update_image()
@@ -556,9 +652,7 @@ class ColorFilterView(ctk.CTkFrame):
     def __game_view_check(self) -> None:
         """Check whether the Game View Radio Button is selected or not."""
         if self.gameview_box._check_state:
-            self.minimap = False
-            self.game_view = True
-            self.control_panel = False
+            self._current_region = "game_view"
             self.image_to_load = None
             self.__import_screenshot()
             self.__update_image()
@@ -566,9 +660,7 @@ class ColorFilterView(ctk.CTkFrame):
     def __control_panel_check(self) -> None:
         """Check whether the Control Panel Radio Button is selected or not."""
         if self.controlpanel_box._check_state:
-            self.minimap = False
-            self.game_view = False
-            self.control_panel = True
+            self._current_region = "control_panel"
             self.image_to_load = None
             self.__import_screenshot()
             self.__update_image()
@@ -1,9 +1,10 @@
+import functools
 import pathlib
 
 import customtkinter as ctk
 
 fonts_path = pathlib.Path(__file__).parent
-ctk.FontManager.load_font(str(fonts_path.joinpath("CascadiaCode.ttf")))
+cascadia_path = str(fonts_path.joinpath("CascadiaCode.ttf"))
 
 
 def get_font(
@@ -19,6 +20,10 @@ def get_font(
     `ctk.CTkFont` class. It offers default values suited for customtkinter's default
     theme fonts.
 
+    Fonts are cached, so every call with the same parameters returns the same shared
+    `CTkFont` object. Never `configure` a returned font, as that would change the text
+    of every widget using it.
+
     To get a list of font families available on a local Windows machine, the following
     two lines of PowerShell lists them in the console:
         ```
@@ -42,11 +47,66 @@ def get_font(
         ctk.CTkFont: Font object to be applied to text displayed in `customtinkter`
             widgets by setting the `font` option.
     """
+    return _get_font_cached(family, size, weight, slant, underline)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_font_cached(
+    family: str, size: int, weight: str, slant: str, underline: bool
+) -> ctk.CTkFont:
+    """Create a `CTkFont` once per unique set of parameters.
+
+    Parameters are passed positionally so that equivalent `get_font` calls always share
+    one cache entry, however their arguments were spelled.
+    """
     return ctk.CTkFont(
         family=family, size=size, weight=weight, slant=slant, underline=underline
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _load_log_font_file() -> bool:
+    """Register the bundled Cascadia Code font file with the OS, only once.
+
+    This is deferred until a log font is first requested, so views without a log don't
+    pay for reading and registering the font file.
+
+    Returns:
+        bool: True if the font file was loaded successfully, False otherwise.
+    """
+    return ctk.FontManager.load_font(cascadia_path)
+
+
+# Default `get_font` parameters for each font preset, overridable per call.
+_PRESETS = {
+    "title": {"size": 24},
+    "heading": {"size": 18, "weight": "bold"},
+    "heading_normal": {"size": 18, "weight": "normal"},
+    "subheading": {"size": 16, "weight": "bold"},
+    "body_large": {"size": 15},
+    "body_med": {"size": 14},
+    "button_med": {"size": 14, "weight": "bold"},
+    "button_small": {"size": 12, "weight": "bold"},
+    "small": {"size": 12},
+    "micro": {"size": 10},
+    "log": {"size": 12, "family": "Cascadia Code"},
+}
+
+
+def preset(name: str, **kwargs) -> ctk.CTkFont:
+    """Get a `CTkFont` from a named preset, with any parameters overridden.
+
+    Args:
+        name (str): The name of the preset in `_PRESETS` (e.g. "title").
+        **kwargs: `get_font` parameters that override those of the preset.
+
+    Returns:
+        ctk.CTkFont: Font object to be applied to text displayed in `customtinkter`
+            widgets by setting the `font` option.
+    """
+    return get_font(**{**_PRESETS[name], **kwargs})
+
+
 def title_font(**kwargs) -> ctk.CTkFont:
     """Get a `CTkFont` preset for titles (largest).
 
@@ -54,9 +114,7 @@ def title_font(**kwargs) -> ctk.CTkFont:
         ctk.CTkFont: Font object to be applied to text displayed in `customtinkter`
             widgets by setting the `font` option.
     """
-    if "size" not in kwargs:
-        kwargs["size"] = 24
-    return get_font(**kwargs)
+    return preset("title", **kwargs)
 
 
 def heading_font(**kwargs) -> ctk.CTkFont:
@@ -66,11 +124,7 @@ def heading_font(**kwargs) -> ctk.CTkFont:
         ctk.CTkFont: Font object to be applied to text displayed in `customtinkter`
             widgets by setting the `font` option.
     """
-    if "size" not in kwargs:
-        kwargs["size"] = 18
-    if "weight" not in kwargs:
-        kwargs["weight"] = "bold"
-    return get_font(**kwargs)
+    return preset("heading", **kwargs)
 
 
 def heading_font_normal(**kwargs) -> ctk.CTkFont:
@@ -80,11 +134,7 @@ def heading_font_normal(**kwargs) -> ctk.CTkFont:
         ctk.CTkFont: Font object to be applied to text displayed in `customtinkter`
             widgets by setting the `font` option.
     """
-    if "size" not in kwargs:
-        kwargs["size"] = 18
-    if "weight" not in kwargs:
-        kwargs["weight"] = "normal"
-    return get_font(**kwargs)
+    return preset("heading_normal", **kwargs)
 
 
 def subheading_font(**kwargs) -> ctk.CTkFont:
@@ -94,11 +144,7 @@ def subheading_font(**kwargs) -> ctk.CTkFont:
         ctk.CTkFont: Font object to be applied to text displayed in `customtinkter`
             widgets by setting the `font` option.
     """
-    if "size" not in kwargs:
-        kwargs["size"] = 16
-    if "weight" not in kwargs:
-        kwargs["weight"] = "bold"
-    return get_font(**kwargs)
+    return preset("subheading", **kwargs)
 
 
 def body_large_font(**kwargs) -> ctk.CTkFont:
@@ -108,9 +154,7 @@ def body_large_font(**kwargs) -> ctk.CTkFont:
         ctk.CTkFont: Font object to be applied to text displayed in `customtinkter`
             widgets by setting the `font` option.
     """
-    if "size" not in kwargs:
-        kwargs["size"] = 15
-    return get_font(**kwargs)
+    return preset("body_large", **kwargs)
 
 
 def body_med_font(**kwargs) -> ctk.CTkFont:
@@ -120,9 +164,7 @@ def body_med_font(**kwargs) -> ctk.CTkFont:
         ctk.CTkFont: Font object to be applied to text displayed in `customtinkter`
             widgets by setting the `font` option.
     """
-    if "size" not in kwargs:
-        kwargs["size"] = 14
-    return get_font(**kwargs)
+    return preset("body_med", **kwargs)
 
 
 def button_med_font(**kwargs) -> ctk.CTkFont:
@@ -132,11 +174,7 @@ def button_med_font(**kwargs) -> ctk.CTkFont:
         ctk.CTkFont: Font object to be applied to text displayed in `customtinkter`
             widgets by setting the `font` option.
     """
-    if "size" not in kwargs:
-        kwargs["size"] = 14
-    if "weight" not in kwargs:
-        kwargs["weight"] = "bold"
-    return get_font(**kwargs)
+    return preset("button_med", **kwargs)
 
 
 def button_small_font(**kwargs) -> ctk.CTkFont:
@@ -146,11 +184,7 @@ def button_small_font(**kwargs) -> ctk.CTkFont:
         ctk.CTkFont: Font object to be applied to text displayed in `customtinkter`
             widgets by setting the `font` option.
     """
-    if "size" not in kwargs:
-        kwargs["size"] = 12
-    if "weight" not in kwargs:
-        kwargs["weight"] = "bold"
-    return get_font(**kwargs)
+    return preset("button_small", **kwargs)
 
 
 def small_font(**kwargs) -> ctk.CTkFont:
@@ -160,9 +194,7 @@ def small_font(**kwargs) -> ctk.CTkFont:
         ctk.CTkFont: Font object to be applied to text displayed in `customtinkter`
             widgets by setting the `font` option.
     """
-    if "size" not in kwargs:
-        kwargs["size"] = 12
-    return get_font(**kwargs)
+    return preset("small", **kwargs)
 
 
 def micro_font(**kwargs) -> ctk.CTkFont:
@@ -172,9 +204,7 @@ def micro_font(**kwargs) -> ctk.CTkFont:
         ctk.CTkFont: Font object to be applied to text displayed in `customtinkter`
             widgets by setting the `font` option.
     """
-    if "size" not in kwargs:
-        kwargs["size"] = 10
-    return get_font(**kwargs)
+    return preset("micro", **kwargs)
 
 
 def log_font(**kwargs) -> ctk.CTkFont:
@@ -184,8 +214,6 @@ def log_font(**kwargs) -> ctk.CTkFont:
         ctk.CTkFont: Font object to be applied to text displayed in `customtinkter`
             widgets by setting the `font` option.
     """
-    if "size" not in kwargs:
-        kwargs["size"] = 12
-    if "family" in kwargs:
-        kwargs.pop("family")
-    return get_font(family="Cascadia Code", **kwargs)
+    kwargs.pop("family", None)  # Log text is always monospaced.
+    _load_log_font_file()
+    return preset("log", **kwargs)
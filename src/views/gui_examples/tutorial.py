@@ -80,5 +80,6 @@ class App(ctk.CTk):
         print("button pressed")
 
 
-app = App()
-app.mainloop()
+if __name__ == "__main__":
+    app = App()
+    app.mainloop()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 
 import customtkinter as ctk
 
@@ -48,7 +48,8 @@ class MyCheckboxFrame(ctk.CTkFrame):
         self.grid_columnconfigure(0, weight=1)
         self.values = values
         self.title = title
-        self.checkboxes = []
+        # Each checkbox is stored with its text so `get` needn't query Tk for it.
+        self.checkboxes: List[Tuple[ctk.CTkCheckBox, str]] = []
 
         self.title = ctk.CTkLabel(
             self, text=self.title, fg_color="#FF0000", corner_radius=0
@@ -58,14 +59,11 @@ class MyCheckboxFrame(ctk.CTkFrame):
         for i, value in enumerate(self.values):
             checkbox = ctk.CTkCheckBox(self, text=value)
             checkbox.grid(row=i + 1, column=0, padx=10, pady=(10, 0), sticky="w")
-            self.checkboxes.append(checkbox)
+            self.checkboxes.append((checkbox, value))
 
     def get(self):
-        checked_checkboxes = []
-        for checkbox in self.checkboxes:
-            if checkbox.get() == 1:  # If the box is checked...
-                checked_checkboxes.append(checkbox.cget("text"))
-        return checked_checkboxes
+        # Collect the text of each checked box.
+        return [text for cb, text in self.checkboxes if cb.get() == 1]
 
 
 class MyRadiobuttonFrame(ctk.CTkFrame):
@@ -90,12 +88,13 @@ class MyRadiobuttonFrame(ctk.CTkFrame):
             radiobutton.grid(row=i + 1, column=0, padx=10, pady=(10, 0), sticky="w")
             self.radiobuttons.append(radiobutton)
 
-        def get(self):
-            return self.variable.get()
+    def get(self):
+        return self.variable.get()
 
-        def set(self, value):
-            self.variable.set(value)
+    def set(self, value):
+        self.variable.set(value)
 
 
-app = App()
-app.mainloop()
+if __name__ == "__main__":
+    app = App()
+    app.mainloop()
@@ -1,3 +1,4 @@
+import functools
 from typing import List
 
 import customtkinter as ctk
@@ -48,11 +49,12 @@ class MyScrollableButtonFrame(ctk.CTkScrollableFrame):
             button = ctk.CTkButton(
                 self,
                 text=button_name,
-                command=lambda name=button_name: master.button_callback(name),
+                command=functools.partial(master.button_callback, button_name),
             )
             button.grid(row=i + 1, column=0, padx=10, pady=(10, 0), sticky="ew")
             self.buttons.append(button)
 
 
-app = App()
-app.mainloop()
+if __name__ == "__main__":
+    app = App()
+    app.mainloop()
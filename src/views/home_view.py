@@ -1,3 +1,6 @@
+import functools
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import customtkinter
@@ -8,6 +11,50 @@ from views.fonts import fonts as fnt
 PATH_SRC = Path(__file__).parents[1]
 PATH_IMG = PATH_SRC / "img"
 PATH_UI = PATH_IMG / "ui"
+PATH_LOGO = str(PATH_UI / "logo.png")
+
+# The static welcome text shown on every home view.
+_WELCOME_TEXT = (
+    "Welcome to RuneDark, a color botting framework for games.\n\nRuneDark is"
+    " designed to develop gaming automation solutions that run while you sleep."
+    " Each folder provides a range of script options, many of which include"
+    " humanizing features such as:\n\n  - Randomized breaks for varying time"
+    " intervals.\n  - Inefficient or randomized pathing.\n  - Curved-path"
+    " cursor movement at variable speeds.\n  - Randomized mouse movements.\n  -"
+    " Moderate zoom speeds at variable rates.\n  - Randomized inventory slot"
+    " selection.\n\nThere's no guarantee any automation will go completely"
+    " unnoticed. The best way to decide whether a bot seems human enough to fly"
+    " under the radar is to watch it in action."
+)
+
+
+def _decode_logo() -> Image.Image:
+    """Decode the Home view splash art into memory.
+
+    Returns:
+        Image.Image: The fully decoded splash art.
+    """
+    with Image.open(PATH_LOGO) as img:
+        return img.copy()
+
+
+# Decode the logo on a worker thread while the rest of the app starts up. Only wrapping
+# it in a `PhotoImage` has to happen on the Tk thread.
+_LOGO_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="home_logo")
+_LOGO_FUTURE = _LOGO_EXECUTOR.submit(_decode_logo)
+_LOGO_EXECUTOR.shutdown(wait=False)  # The worker exits once the logo is decoded.
+
+
+@functools.lru_cache(maxsize=None)
+def _home_logo() -> ImageTk.PhotoImage:
+    """Load the Home view splash art once, reusing it across every Home view.
+
+    Note that a Tk root window must exist before this is first called.
+
+    Returns:
+        ImageTk.PhotoImage: The Home view splash art.
+    """
+    return ImageTk.PhotoImage(_LOGO_FUTURE.result())
 
 
 class HomeView(customtkinter.CTkFrame):
@@ -28,8 +75,7 @@ class HomeView(customtkinter.CTkFrame):
     def _setup_grid(self) -> None:
         """Configure the grid layout for the UI components."""
         self.grid_columnconfigure(0, weight=1)
-        self.grid_rowconfigure(0, weight=0)  # - Title
-        self.grid_rowconfigure(1, weight=0)  # - Note
+        self.grid_rowconfigure((0, 1), weight=0)  # - Title, Note
         self.grid_rowconfigure(2, weight=1)  # - Logo
 
     def _create_title_text(self) -> None:
@@ -43,33 +89,40 @@ class HomeView(customtkinter.CTkFrame):
 
     def _create_welcome_text(self) -> None:
         """Create a label to display the main welcome and introduction."""
-        self.txt_welcome = (
-            "Welcome to RuneDark, a color botting framework for games.\n\nRuneDark is"
-            " designed to develop gaming automation solutions that run while you sleep."
-            " Each folder provides a range of script options, many of which include"
-            " humanizing features such as:\n\n  - Randomized breaks for varying time"
-            " intervals.\n  - Inefficient or randomized pathing.\n  - Curved-path"
-            " cursor movement at variable speeds.\n  - Randomized mouse movements.\n  -"
-            " Moderate zoom speeds at variable rates.\n  - Randomized inventory slot"
-            " selection.\n\nThere's no guarantee any automation will go completely"
-            " unnoticed. The best way to decide whether a bot seems human enough to fly"
-            " under the radar is to watch it in action."
-        )
+        self.txt_welcome = _WELCOME_TEXT
         self.lbl_welcome = customtkinter.CTkLabel(
             master=self, text=self.txt_welcome, font=fnt.body_med_font(), justify="left"
         )
-        self.lbl_welcome.bind(
-            "<Configure>",
-            lambda e: self.lbl_welcome.configure(
-                wraplength=self.lbl_welcome.winfo_width() - 20
-            ),
-        )
+        # Resizing fires many `<Configure>` events, so rewrap only once it settles.
+        self._resize_job = None
+        self._last_wraplength = None
+        self.lbl_welcome.bind("<Configure>", self.__on_welcome_configure)
         self.lbl_welcome.grid(row=1, column=0, sticky="nwe", padx=5, pady=(10, 10))
 
     def _create_home_logo(self) -> None:
         """Create and display the Home view splash art."""
-        self.logo = ImageTk.PhotoImage(Image.open(str(PATH_UI / "logo.png")))
+        self.logo = _home_logo()
         self.label_logo = customtkinter.CTkLabel(self, image=self.logo, text="")
         self.label_logo.grid(
             row=2, column=0, columnspan=3, sticky="se", padx=15, pady=0
         )
+
+    def __on_welcome_configure(self, event: tk.Event) -> None:
+        """Schedule the welcome text to be rewrapped, replacing any pending rewrap.
+
+        Args:
+            event (tk.Event): The event triggered when the welcome label is resized.
+                While it is not used directly in this function, it is required by
+                the binding.
+        """
+        if self._resize_job:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(50, self.__apply_wraplength)
+
+    def __apply_wraplength(self) -> None:
+        """Wrap the welcome text to the label's current width, if it has changed."""
+        self._resize_job = None
+        wraplength = self.lbl_welcome.winfo_width() - 20
+        if wraplength != self._last_wraplength:
+            self._last_wraplength = wraplength
+            self.lbl_welcome.configure(wraplength=wraplength)
@@ -1,12 +1,13 @@
+import time
 import tkinter
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 import customtkinter as ctk
-from PIL import Image, ImageTk
 from pynput import keyboard
 
+import utilities.keyboard_hub as keyboard_hub
 import utilities.settings as settings
+from views._icon_cache import load_icon
 from views.fonts import fonts as fnt
 
 if TYPE_CHECKING:
@@ -14,22 +15,22 @@ if TYPE_CHECKING:
     from views.bot_view import BotView
 
 
-PATH_SRC = Path(__file__).parents[1]
-PATH_IMG = PATH_SRC / "img"
-PATH_UI = PATH_IMG / "ui"
 DEFAULT_GRAY = ("gray50", "gray30")  # 50% white (50% black) and 30% white (70% black).
 COLOR_HOVER = "#203a4f"  # Dark, muted blue.
+HOTKEY_DEADTIME = 0.25  # Seconds to ignore the Play/Stop keybind after it fires.
 
 
 class InfoFrame(ctk.CTkFrame):
-    listener = None
-    pressed = False
-    current_keys = set()
-    combination_keys = settings.get("keybind") or [
-        keyboard.Key.shift_l,
-        keyboard.Key.enter,
-    ]
-    status = "stopped"
+    # The keybind is read once at startup and shared, as it is never mutated.
+    combination_keys = tuple(
+        settings.get("keybind") or (keyboard.Key.shift_l, keyboard.Key.enter)
+    )
+    # The keybind only changes after a restart, so its hover text is formatted once.
+    combination_text = settings.keybind_to_text(combination_keys)
+    # Each combination key is given one bit, so that checking whether the whole
+    # combination is held is a single integer comparison.
+    _combo_bits = {key: 1 << i for i, key in enumerate(dict.fromkeys(combination_keys))}
+    _combo_mask = (1 << len(_combo_bits)) - 1
 
     def __init__(self, parent: "BotView", title: str, info: str) -> None:
         """Initialize an `InfoFrame` as a 5x2 frame of widgets.
@@ -51,6 +52,18 @@ class InfoFrame(ctk.CTkFrame):
         self.info = info
         self.controller = None  # The controller and script options are set later.
         self.options_class = None
+        self.status = "stopped"
+        # Keybind state is per instance, as each frame tracks its own key presses.
+        self.pressed = False
+        self._pressed_mask = 0  # Bits of the combination keys currently held down.
+        self._last_trigger = 0.0  # Monotonic time the keybind last fired.
+        self._options_window = None  # Built on first use, then hidden and reused.
+        self._options_model = None  # The bot model whose options the window holds.
+        self._button_states = {}  # The last state set on each control button.
+        # Progress updates are coalesced, so only the latest value is ever drawn.
+        self._pending_progress = 0.0
+        self._progress_scheduled = False
+        self._last_percent = 0
         self._setup_grid()
         self._create_script_title_text()
         self._create_description_text()
@@ -89,12 +102,10 @@ class InfoFrame(ctk.CTkFrame):
             height=150,
         )
         self.lbl_script_desc.grid(column=0, row=2, sticky="nwe", padx=5)
-        self.lbl_script_desc.bind(
-            "<Configure>",
-            lambda e: self.lbl_script_desc.configure(
-                wraplength=self.lbl_script_desc.winfo_width() - 10
-            ),
-        )
+        # Resizing fires many `<Configure>` events, so rewrap only once it settles.
+        self._wrap_job = None
+        self._last_wraplength = None
+        self.lbl_script_desc.bind("<Configure>", self.__on_desc_configure)
 
     def _create_percentage_progress_text(self) -> None:
         """Create a label for script progress as a percentage."""
@@ -115,18 +126,10 @@ class InfoFrame(ctk.CTkFrame):
     def _load_control_buttons(self) -> None:
         """Create the right-side control buttons on above the console log."""
         img_size = 18
-        self.img_play = ImageTk.PhotoImage(
-            Image.open(str(PATH_UI / "play.png")).resize((img_size, img_size)),
-            Image.LANCZOS,
-        )
-        self.img_stop = ImageTk.PhotoImage(
-            Image.open(str(PATH_UI / "stop.png")).resize((img_size, img_size)),
-            Image.LANCZOS,
-        )
-        self.img_options = ImageTk.PhotoImage(
-            Image.open(str(PATH_UI / "options.png")).resize((img_size, img_size)),
-            Image.LANCZOS,
-        )
+        # The icons are cached and shared, so only the first frame has to load them.
+        self.img_play = load_icon("play.png", img_size)
+        self.img_stop = load_icon("stop.png", img_size)
+        self.img_options = load_icon("options.png", img_size)
 
         # Create a frame to contain the Play/Stop and Options buttons.
         self.btn_frame = ctk.CTkFrame(master=self, fg_color="#333333")
@@ -148,9 +151,7 @@ class InfoFrame(ctk.CTkFrame):
         )
         self.btn_play.bind(
             "<Enter>",
-            lambda event: self.btn_play.configure(
-                text=f"{settings.keybind_to_text(self.combination_keys)}"
-            ),
+            lambda event: self.btn_play.configure(text=self.combination_text),
         )
         self.btn_play.bind(
             "<Leave>", lambda event: self.btn_play.configure(text="Play")
@@ -173,13 +174,14 @@ class InfoFrame(ctk.CTkFrame):
         )
         self.btn_stop.bind(
             "<Enter>",
-            lambda event: self.btn_stop.configure(
-                text=f"{settings.keybind_to_text(self.combination_keys)}"
-            ),
+            lambda event: self.btn_stop.configure(text=self.combination_text),
         )
         self.btn_stop.bind(
             "<Leave>", lambda event: self.btn_stop.configure(text="Stop")
         )
+        # The Play and Stop buttons share a cell, and only the raised one is visible.
+        self.btn_stop.grid(row=1, column=0, pady=(0, 0), sticky="nsew")
+        self.btn_play.lift()
 
     def _create_options_button(self) -> None:
         """Create and configure the Options button."""
@@ -211,6 +213,26 @@ class InfoFrame(ctk.CTkFrame):
         )
         self.lbl_status.grid(row=5, column=1, pady=(0, 15), sticky="we")
 
+    def __on_desc_configure(self, event: tkinter.Event) -> None:
+        """Schedule the description to be rewrapped, replacing any pending rewrap.
+
+        Args:
+            event (tkinter.Event): The event triggered when the description label is
+                resized. While it is not used directly in this function, it is required
+                by the binding.
+        """
+        if self._wrap_job:
+            self.after_cancel(self._wrap_job)
+        self._wrap_job = self.after(50, self.__apply_wraplength)
+
+    def __apply_wraplength(self) -> None:
+        """Wrap the description to the label's current width, if it has changed."""
+        self._wrap_job = None
+        wraplength = self.lbl_script_desc.winfo_width() - 10
+        if wraplength != self._last_wraplength:
+            self._last_wraplength = wraplength
+            self.lbl_script_desc.configure(wraplength=wraplength)
+
     # --- Setup ---
     def set_controller(self, controller: "BotController") -> None:
         """Set the the associated controller for the `InfoFrame` for this `Bot`.
@@ -238,100 +260,119 @@ class InfoFrame(ctk.CTkFrame):
     def __on_options_btn_clicked(self) -> None:
         """Press options on the `BotController`.
 
-        This creates a new `CtkTopLevel` view to display bot options.
+        The first click creates a `CtkTopLevel` view to display bot options. Once
+        options are saved, later clicks show that same window again rather than
+        rebuilding it, unless the controller has since switched to a different bot (or
+        the saved options were rejected), in which case the old window is destroyed and
+        a new one is built for the current bot.
         """
-        window = ctk.CTkToplevel(master=self)
-        window.title("Options")
-        window.protocol(
-            "WM_DELETE_WINDOW", lambda arg=window: self.__on_options_closing(arg)
-        )
-
-        view = self.controller.get_options_view(parent=window)
-        view.pack(side="top", fill="both", expand=True, padx=20, pady=20)
+        model = self.controller.model
+        window = self._options_window
+        if window is not None and not window.winfo_exists():
+            window = None
+        if window is not None and (
+            model is not self._options_model or not model.options_set
+        ):
+            window.destroy()  # Its widgets don't match the current bot's options.
+            window = None
+        if window is not None:
+            self.controller.reopen_options()
+            window.deiconify()
+        else:
+            window = ctk.CTkToplevel(master=self)
+            window.title("Options")
+            window.protocol("WM_DELETE_WINDOW", self.__on_options_closing)
+            view = self.controller.get_options_view(parent=window)
+            view.pack(side="top", fill="both", expand=True, padx=20, pady=20)
+            self._options_window = window
+            self._options_model = model
         window.after(
             100, window.lift
         )  # The 100ms wait is a workaround for the main window focusing first.
 
-    def __on_options_closing(self, window) -> None:
-        """Perform cleanup operations when the options window is closed."""
+    def __on_options_closing(self) -> None:
+        """Perform cleanup operations when the options window is closed.
+
+        Closing the window aborts the edit, so it is destroyed rather than hidden:
+        its widgets may hold unsaved values, and the next click builds a fresh one.
+        """
         self.controller.abort_options()
-        window.destroy()
+        self._options_window.destroy()
+        self._options_window = None
 
     # --- Keyboard Interrupt Handlers ---
     def start_keyboard_listener(self) -> None:
-        """Start a `keyboard.Listener` to monitor key press and release events.
+        """Monitor key press and release events via the shared keyboard listener.
 
-        This method initializes a keyboard listener that triggers corresponding actions
-        based on specific key combinations. The listener runs in the background.
+        This method subscribes to the application-wide keyboard listener so that
+        corresponding actions are triggered based on specific key combinations. The
+        listener runs in the background.
         """
-        self.listener = keyboard.Listener(
-            on_press=self.__on_key_press,
-            on_release=self.__on_key_release,
-        )
-        self.listener.start()
+        keyboard_hub.subscribe(self.__on_key_press, self.__on_key_release)
 
     def stop_keyboard_listener(self) -> None:
-        """Stop a `keyboard.Listener`.
+        """Stop monitoring key events.
 
-        This method terminates an active keyboard listener that was started with the
-        `start_keyboard_listener` method.
+        This method unsubscribes the handlers registered by `start_keyboard_listener`
+        from the shared keyboard listener.
         """
-        self.listener.stop()
+        keyboard_hub.unsubscribe(self.__on_key_press, self.__on_key_release)
 
     def __on_key_press(self, key: keyboard.Key) -> None:
         """Handle key press events.
 
-        This method is called when a key is pressed. It adds the pressed key to the set
-        of currently pressed keys and checks if a predefined combination of keys is
+        This method is called when a key is pressed. It marks the pressed key as held
+        if it is part of the combination, and checks if the whole combination is
         active. Depending on the current status of the application, it may stop or
-        start the controller.
+        start the controller. The combination fires immediately, but is then ignored
+        for `HOTKEY_DEADTIME` seconds so that key auto-repeat cannot toggle the bot
+        twice.
 
         Args:
             key (keyboard.Key): The key that was pressed.
         """
-        self.current_keys.add(key)
+        self._pressed_mask |= self._combo_bits.get(key, 0)
 
-        if (
-            all(k in self.current_keys for k in self.combination_keys)
-            and not self.pressed
-        ):
+        if self._pressed_mask == self._combo_mask and not self.pressed:
+            now = time.monotonic()
+            if now - self._last_trigger < HOTKEY_DEADTIME:
+                return
+            self._last_trigger = now
             self.pressed = True
             if self.status == "running":
                 self.controller.stop()
             elif self.status == "stopped":
                 self.controller.play()
                 self.pressed = False
-                self.current_keys.clear()
+                self._pressed_mask = 0
 
     def __on_key_release(self, key: keyboard.Key) -> None:
         """Handle key release events.
 
-        This method is called when a key is released. It removes the released key from
-        the set of currently pressed keys. If none of the combination keys are active,
-        it resets the pressed state.
+        This method is called when a key is released. It clears the released key's bit
+        from the held combination keys. If none of the combination keys are active, it
+        resets the pressed state.
 
         Args:
             key (keyboard.Key): The key that was released.
         """
-        self.current_keys.discard(key)
-        if all(k not in self.current_keys for k in self.combination_keys):
+        self._pressed_mask &= ~self._combo_bits.get(key, 0)
+        if not self._pressed_mask:
             self.pressed = False
 
     # --- `BotView` Status Handlers ---
     def update_status_running(self) -> None:
         """Update the `BotView` to show that the `Bot` is running."""
         self.__toggle_buttons(True)
-        self.btn_options.configure(state=tkinter.DISABLED)
-        self.btn_play.grid_forget()
-        self.btn_stop.grid(row=1, column=0, pady=(0, 0), sticky="nsew")
+        self.__set_button_state(self.btn_options, tkinter.DISABLED)
+        self.btn_stop.lift()  # Raising is cheaper than re-running the grid layout.
         self.lbl_status.configure(text="Status: Running")
         self.status = "running"
 
     def update_status_stopped(self) -> None:
         """Update the `BotView` to show that the `Bot` is stopped."""
         self.__toggle_buttons(True)
-        self.btn_stop.grid_forget()
-        self.btn_play.grid(row=1, column=0, pady=(0, 0), sticky="nsew")
+        self.btn_play.lift()
         self.lbl_status.configure(text="Status: Stopped")
         self.status = "stopped"
 
@@ -353,24 +394,47 @@ class InfoFrame(ctk.CTkFrame):
                 clickable state). If False, the buttons will be disabled (greyed out
                 and unclickable).
         """
-        if enabled:
-            self.btn_play.configure(state=tkinter.NORMAL)
-            self.btn_stop.configure(state=tkinter.NORMAL)
-            self.btn_options.configure(state=tkinter.NORMAL)
-        else:
-            self.btn_play.configure(state=tkinter.DISABLED)
-            self.btn_stop.configure(state=tkinter.DISABLED)
-            self.btn_options.configure(state=tkinter.DISABLED)
+        state = tkinter.NORMAL if enabled else tkinter.DISABLED
+        for btn in (self.btn_play, self.btn_stop, self.btn_options):
+            self.__set_button_state(btn, state)
+
+    def __set_button_state(self, btn: ctk.CTkButton, state: str) -> None:
+        """Set a control button's state, skipping the update if it is unchanged.
+
+        Reconfiguring a CTk button redraws it even when nothing has changed, and the
+        status handlers reassert the same states often.
+
+        Args:
+            btn (ctk.CTkButton): The control button to update.
+            state (str): Either `tkinter.NORMAL` or `tkinter.DISABLED`.
+        """
+        if self._button_states.get(btn) != state:
+            self._button_states[btn] = state
+            btn.configure(state=state)
 
     # --- Progress Bar Handlers ---
     def update_progress(self, progress: float) -> None:
         """Update the progress bar and completion percentage label on the `BotView`.
 
         The controller tells the view to update the progress bar and percentage label.
+        Bots may report progress many times per second, so updates are coalesced and
+        drawn at most about 30 times per second.
 
         Args:
             progress (float):  The script's progress, ranging from 0 (no progress) to 1
                 (fully complete).
         """
+        self._pending_progress = progress
+        if not self._progress_scheduled:
+            self._progress_scheduled = True
+            self.after(33, self.__flush_progress)
+
+    def __flush_progress(self) -> None:
+        """Draw the latest reported progress, relabeling only if the percent changed."""
+        self._progress_scheduled = False
+        progress = self._pending_progress
         self.progressbar.set(progress)
-        self.lbl_progress.configure(text=f"Progress: {progress*100:.0f}%")
+        percent = round(progress * 100)
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.lbl_progress.configure(text=f"Progress: {percent}%")
@@ -9,6 +9,9 @@ if TYPE_CHECKING:
     from controller.bot_controller import BotController
     from views.bot_view import BotView
 
+MAX_LOG_LINES = 2000  # Older lines are trimmed so the log does not grow unbounded.
+TRIM_EVERY_N_FLUSHES = 10
+
 
 class OutputLogFrame(ctk.CTkFrame):
     """A 2 row x 1 column frame for console log output."""
@@ -24,6 +27,10 @@ class OutputLogFrame(ctk.CTkFrame):
         """
         super().__init__(parent)
         self.controller = None
+        # New messages are buffered and written to the log together, in one insert.
+        self._log_buffer = []
+        self._log_job = None
+        self._flushes_since_trim = 0
         self._setup_grid()
         self._create_log_title_text()
         self._create_console_log_text_box()
@@ -84,25 +91,62 @@ class OutputLogFrame(ctk.CTkFrame):
 
         The controller tells the view to update the log, adding a new message to the
         console by either appending it or replacing the last line depending on the
-        `overwrite` flag.
+        `overwrite` flag. Appended messages are buffered briefly so that a burst of
+        them is written to the console with a single insert.
 
         Args:
             msg (str): The message to add to the console log.
             overwrite (bool, optional): If True, replaces the last log line with the
                 new message. Defaults to False.
         """
+        if not overwrite:
+            self._log_buffer.append("\n" + msg)
+            if self._log_job is None:
+                self._log_job = self.after(50, self.__flush_log)
+            return
+        self.__flush_log()  # The line to replace may still be buffered.
         self.txt_log.configure(state=tkinter.NORMAL)
-        if overwrite:
-            self.txt_log.delete("end-1c linestart", "end")
+        self.txt_log.delete("end-1c linestart", "end")
         self.txt_log.insert(tkinter.END, "\n" + msg)
         self.txt_log.configure(state=tkinter.DISABLED)
         self.txt_log.see(tkinter.END)
 
+    def __flush_log(self) -> None:
+        """Write all buffered messages to the console log at once."""
+        if self._log_job is not None:
+            self.after_cancel(self._log_job)
+            self._log_job = None
+        if not self._log_buffer:
+            return
+        self.txt_log.configure(state=tkinter.NORMAL)
+        self.txt_log.insert(tkinter.END, "".join(self._log_buffer))
+        self._flushes_since_trim += 1
+        if self._flushes_since_trim >= TRIM_EVERY_N_FLUSHES:
+            self._flushes_since_trim = 0
+            self.__trim_log()
+        self.txt_log.configure(state=tkinter.DISABLED)
+        self.txt_log.see(tkinter.END)
+        self._log_buffer.clear()
+
+    def __trim_log(self) -> None:
+        """Delete the oldest lines once the log exceeds `MAX_LOG_LINES` lines.
+
+        Note that the text box must be in its editable (NORMAL) state.
+        """
+        num_lines = int(self.txt_log.index("end-1c").split(".")[0])
+        excess = num_lines - MAX_LOG_LINES
+        if excess > 0:
+            self.txt_log.delete("1.0", f"{excess + 1}.0")
+
     def clear_log(self) -> None:
         """Clear the log of all messages.
 
         The controller tells the view to clear the log.
         """
+        if self._log_job is not None:
+            self.after_cancel(self._log_job)
+            self._log_job = None
+        self._log_buffer.clear()
         self.txt_log.configure(state=tkinter.NORMAL)
         self.txt_log.delete(1.0, tkinter.END)
         self.txt_log.configure(state=tkinter.DISABLED)
@@ -1,17 +1,11 @@
-import contextlib
-from pathlib import Path
-
 import customtkinter as ctk
 import pynput.keyboard as keyboard
-from PIL import Image, ImageTk
 
+import utilities.keyboard_hub as keyboard_hub
 import utilities.settings as settings
+from views._icon_cache import load_icon
 from views.fonts import fonts as fnt
 
-PATH_SRC = Path(__file__).parents[1]
-PATH_IMG = PATH_SRC / "img"
-PATH_UI = PATH_IMG / "ui"
-
 DEFAULT_GRAY = ("gray50", "gray30")  # 50% white (50% black) and 30% white (70% black).
 COLOR_HOVER = "#203a4f"  # Dark, muted blue.
 IMG_SIZE = 18
@@ -32,7 +26,12 @@ class SettingsView(ctk.CTkFrame):
         self.parent = parent
         self.parent.protocol("WM_DELETE_WINDOW", self.__on_closing)
         self.entry_username = settings.get("username")
-        self.current_keybind = settings.get("keybind")  # List of keyboard.Key objects.
+        self.current_keybind = settings.get("keybind") or []  # List of keyboard.Key.
+        # The displayed text of each key in the keybind, so that a key press only has
+        # to format the key that was pressed.
+        self._keybind_text_parts = [
+            settings.key_to_text(key) for key in self.current_keybind
+        ]
         self.parent.resizable(False, False)
         self._setup_grid()
         self._load_button_icons()
@@ -92,11 +91,7 @@ class SettingsView(ctk.CTkFrame):
             anchor="w",
             width=269,  # This width pushes the Entry and Button snugly to the right.
         )
-        txt_keybind = (
-            settings.keybind_to_text(self.current_keybind)
-            if self.current_keybind
-            else "None"
-        )
+        txt_keybind = " + ".join(self._keybind_text_parts) or "None"
         self.entry_keybind = ctk.CTkLabel(
             master=self.frame_keybind,
             text=txt_keybind,
@@ -180,21 +175,9 @@ class SettingsView(ctk.CTkFrame):
 
     def _load_button_icons(self) -> None:
         """Load relevant icons and standardize their sizes."""
-        self.img_edit = ImageTk.PhotoImage(
-            Image.open(PATH_UI / "edit.png").resize(
-                (IMG_SIZE, IMG_SIZE), Image.Resampling.LANCZOS
-            )
-        )
-        self.img_check = ImageTk.PhotoImage(
-            Image.open(PATH_UI / "check.png").resize(
-                (IMG_SIZE, IMG_SIZE), Image.Resampling.LANCZOS
-            )
-        )
-        self.img_save = ImageTk.PhotoImage(
-            Image.open(PATH_UI / "save.png").resize(
-                (IMG_SIZE, IMG_SIZE), Image.Resampling.LANCZOS
-            )
-        )
+        self.img_edit = load_icon("edit.png", IMG_SIZE)
+        self.img_check = load_icon("check.png", IMG_SIZE)
+        self.img_save = load_icon("save.png", IMG_SIZE)
 
     def _create_save_button(self) -> None:
         """Create a Save button that closes the Settings window upon click."""
@@ -213,16 +196,11 @@ class SettingsView(ctk.CTkFrame):
     # --- Keyboard Interrupt Handlers ---
     def start_keyboard_listener(self) -> None:
         """Start listening for key presses to capture new keybind input."""
-        self.listener = keyboard.Listener(
-            on_press=self.__on_press,
-            on_release=self.__on_release,
-        )
-        self.listener.start()
+        keyboard_hub.subscribe(self.__on_press, self.__on_release)
 
     def stop_keyboard_listener(self) -> None:
         """Stop the keyboard listener, preventing further key input."""
-        with contextlib.suppress(AttributeError):
-            self.listener.stop()
+        keyboard_hub.unsubscribe(self.__on_press, self.__on_release)
 
     def __on_press(self, key: keyboard.Key) -> None:
         """Handle key presses and update the keybind label.
@@ -233,13 +211,11 @@ class SettingsView(ctk.CTkFrame):
         if key == keyboard.Key.esc:
             self.entry_keybind.configure(text="")
             self.current_keybind.clear()
+            self._keybind_text_parts.clear()
             return
         self.current_keybind.append(key)
-        self.entry_keybind.configure(
-            text=f"{settings.keybind_to_text(self.current_keybind)}",
-            width=133,
-            height=64,
-        )
+        self._keybind_text_parts.append(settings.key_to_text(key))
+        self.entry_keybind.configure(text=" + ".join(self._keybind_text_parts))
 
     def __on_release(self, key: keyboard.Key) -> None:
         """Handle key release events. Currently an unused placeholder."""
@@ -274,22 +250,23 @@ class SettingsView(ctk.CTkFrame):
         Args:
             window (CTkToplevel): The top-level customtkinter window.
         """
+        self.stop_keyboard_listener()  # Stop capturing keys before the view is gone.
         txt_entry_username = self.entry_username.get()
 
         # Handle keybind saving.
         if not self.current_keybind:
             print("No keybind set, using default 'Shift + Enter'.")
             self.current_keybind = [keyboard.Key.shift_r, keyboard.Key.enter]
-        settings.set("keybind", self.current_keybind)
+        new_settings = {"keybind": self.current_keybind}
         print(f"Keybind set to: {settings.keybind_to_text(self.current_keybind)}")
 
         # Handle username saving.
         if not txt_entry_username:
             print("No username provided.")
-            window.destroy()
         else:
-            settings.set("username", txt_entry_username)
+            new_settings["username"] = txt_entry_username
             print(f"Username set to: {txt_entry_username}")
+        settings.update(new_settings)  # Write all changed settings at once.
 
         # Inform user that a restart is required.
         if txt_entry_username or self.current_keybind:
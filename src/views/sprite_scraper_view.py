@@ -1,22 +1,27 @@
+import queue
+import sys
 import threading
 import tkinter
-from pathlib import Path
+from typing import Optional
 
 import customtkinter as ctk
-from PIL import Image, ImageTk
 
 from utilities.sprite_scraper import SpriteScraper
+from views._icon_cache import load_ctk_icon
 from views.fonts import fonts as fnt
 
 SCRAPER = SpriteScraper()
 
-PATH_SRC = Path(__file__).parents[1]
-PATH_IMG = PATH_SRC / "img"
-PATH_UI = PATH_IMG / "ui"
-
 DEFAULT_GRAY = ("gray50", "gray30")  # 50% white (50% black) and 30% white (70% black).
 COLOR_HOVER = "#203a4f"  # Dark, muted blue.
 IMG_SIZE = 24
+CONTROL_MASK = 0x0004  # Set in a Tk event's `state` while Control is held.
+COMMAND_MASK = 0x0008  # Set in a Tk event's `state` while Command is held on macOS.
+# The modifiers that copy with C: Ctrl everywhere, and also Command on macOS.
+COPY_MASK = CONTROL_MASK | (COMMAND_MASK if sys.platform == "darwin" else 0)
+MAX_LOG_LINES = 1000  # The oldest log lines are trimmed beyond this many.
+LOG_POLL_MS = 50  # How often messages from the scraper thread are written to the log.
+LOG_BATCH_MAX = 200  # The most messages written to the log in one batch.
 
 
 class SpriteScraperView(ctk.CTkFrame):
@@ -30,8 +35,13 @@ class SpriteScraperView(ctk.CTkFrame):
         """
         super().__init__(parent)
         self.parent = parent
-        self.parent.protocol("WM_DELETE_WINDOW", self.__on_closing)
+        self.parent.protocol("WM_DELETE_WINDOW", self.hide)  # Hide it for reuse.
         self.parent.resizable(False, False)
+        self._log_lines = 0  # The number of lines currently in the log.
+        # The scraper reports from a worker thread, so its messages are queued and
+        # written to the log in batches on the UI thread.
+        self._log_queue = queue.SimpleQueue()
+        self._log_job = self.after(LOG_POLL_MS, self.__drain_log)
 
         self._setup_grid()
         self._create_title_text()
@@ -55,11 +65,8 @@ class SpriteScraperView(ctk.CTkFrame):
             - Row 5 (logs) to expand with the window.
         """
         self.grid_columnconfigure(0, weight=1)
-        self.grid_rowconfigure(0, weight=0)  # - Title
-        self.grid_rowconfigure(1, weight=0)  # - Search Info
-        self.grid_rowconfigure(2, weight=0)  # - Radio Group
-        self.grid_rowconfigure(3, weight=0)  # - Search Entry
-        self.grid_rowconfigure(4, weight=0)  # - Submit
+        # - Title, Search Info, Radio Group, Search Entry, and Submit
+        self.grid_rowconfigure((0, 1, 2, 3, 4), weight=0)
         self.grid_rowconfigure(5, weight=1)  # - Logs
 
     def _create_title_text(self) -> None:
@@ -92,12 +99,8 @@ class SpriteScraperView(ctk.CTkFrame):
     def _create_radio_group(self) -> None:
         """Configure the main options as a group of radio buttons."""
         self.radio_group = ctk.CTkFrame(self, fg_color="#2b2b2b")
-        self.radio_group.grid_columnconfigure(0, weight=1)
-        self.radio_group.grid_columnconfigure(1, weight=1)
-        self.radio_group.grid_rowconfigure(0, weight=1)
-        self.radio_group.grid_rowconfigure(1, weight=1)
-        self.radio_group.grid_rowconfigure(2, weight=1)
-        self.radio_group.grid_rowconfigure(3, weight=1)
+        self.radio_group.grid_columnconfigure((0, 1), weight=1)
+        self.radio_group.grid_rowconfigure((0, 1, 2, 3), weight=1)
         self.radio_group.grid(columnspan=2)
 
     def _create_radio_buttons(self) -> None:
@@ -147,10 +150,7 @@ class SpriteScraperView(ctk.CTkFrame):
 
     def _create_submit_button(self) -> None:
         """Create the submit button with which to submit search queries."""
-        self.img_submit = ImageTk.PhotoImage(
-            Image.open(PATH_UI / "submit.png").resize((IMG_SIZE, IMG_SIZE)),
-            Image.LANCZOS,
-        )
+        self.img_submit = load_ctk_icon("submit.png", IMG_SIZE)
         self.search_submit_button = ctk.CTkButton(
             self,
             text="Submit",
@@ -178,7 +178,11 @@ class SpriteScraperView(ctk.CTkFrame):
             fg="#ffffff",
         )
         self.txt_logs.grid(row=1, column=0, sticky="nsew", padx=0, pady=0)
-        self.txt_logs.configure(state=tkinter.DISABLED)
+        # The log stays in its NORMAL state, so that writing to it needs no state
+        # toggling. User edits are blocked instead, while Ctrl+C still copies.
+        self.txt_logs.bind("<Key>", self.__on_log_key)
+        for sequence in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>"):
+            self.txt_logs.bind(sequence, lambda event: "break")
         self.log_frame.grid(row=5, column=0, sticky="nsew", padx=13, pady=13)
 
         self.scrollbar = ctk.CTkScrollbar(master=self, command=self.txt_logs.yview)
@@ -186,10 +190,38 @@ class SpriteScraperView(ctk.CTkFrame):
         # Connect textbox scroll events to the scrollbar.
         self.txt_logs.configure(yscrollcommand=self.scrollbar.set)
 
+    def show(self) -> None:
+        """Show the Sprite Scraper window again after `hide`, resuming the log."""
+        if self._log_job is None:
+            self.__drain_log()
+        self.parent.deiconify()
+        self.parent.lift()
+
+    def hide(self) -> None:
+        """Hide the Sprite Scraper window for reuse, pausing the log until shown.
+
+        Messages the scraper reports while the window is hidden stay queued.
+        """
+        if self._log_job is not None:
+            self.after_cancel(self._log_job)
+            self._log_job = None
+        self.parent.withdraw()
+
     # --- Handlers ---
-    def __on_closing(self) -> None:
-        """Handle the event where the Sprite Scraper is closed (e.g. clicking X)."""
-        self.parent.destroy()
+    def __on_log_key(self, event: tkinter.Event) -> Optional[str]:
+        """Block key presses that would edit the log, other than copying with Ctrl+C.
+
+        On macOS, copying with Cmd+C is allowed too.
+
+        Args:
+            event (tkinter.Event): The key press event on the log.
+
+        Returns:
+            Optional[str]: "break" to stop the key press from reaching the log.
+        """
+        if event.state & COPY_MASK and event.keysym.lower() == "c":
+            return None
+        return "break"
 
     def __on_submit(self) -> None:
         """Handle the event where a search query is submitted."""
@@ -204,19 +236,45 @@ class SpriteScraperView(ctk.CTkFrame):
             daemon=True,
         )
         self.search_entry.delete(0, "end")
-        self.txt_logs.configure(state=tkinter.NORMAL)
         # The following line would delete the previous log before adding new info.
         # self.txt_logs.delete("1.0", "end")
-        self.txt_logs.configure(state=tkinter.DISABLED)
         thread.start()
 
     def __update_log(self, text: str) -> None:
-        """Update the Sprite Scraper log with the given text.
+        """Queue the given text to be added to the Sprite Scraper log.
+
+        Note that this method is safe to call from the scraper's worker thread.
 
         Args:
             text (str): The text with which to update the log.
         """
-        self.txt_logs.configure(state=tkinter.NORMAL)
+        self._log_queue.put(text)
+
+    def __drain_log(self) -> None:
+        """Write queued log messages to the log in one batch, then reschedule."""
+        batch = []
+        while len(batch) < LOG_BATCH_MAX:
+            try:
+                batch.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self.__write_log("\n".join(batch))
+        self._log_job = self.after(LOG_POLL_MS, self.__drain_log)
+
+    def __write_log(self, text: str) -> None:
+        """Append text to the Sprite Scraper log on a new line.
+
+        Args:
+            text (str): The text to append, which may span several lines.
+        """
+        at_bottom = self.txt_logs.yview()[1] >= 0.999
         self.txt_logs.insert("end", "\n" + text)
-        self.txt_logs.configure(state=tkinter.DISABLED)
-        self.txt_logs.see(tkinter.END)
+        self._log_lines += text.count("\n") + 1
+        if self._log_lines > MAX_LOG_LINES:
+            # Trim only the overflow from the top rather than rewriting the log.
+            excess = self._log_lines - MAX_LOG_LINES
+            self.txt_logs.delete("1.0", f"{excess + 1}.0")
+            self._log_lines = MAX_LOG_LINES
+        if at_bottom:  # Only follow new output if the user has not scrolled up.
+            self.txt_logs.see(tkinter.END)
@@ -1,11 +1,12 @@
 import webbrowser as wb
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Union
 
 import customtkinter as ctk
 from PIL import Image, ImageTk
 
 from utilities import settings
+from views._icon_cache import load_ctk_icon, preload_icons
 from views.auth_view import AuthView
 from views.color_filter_view import ColorFilterView
 from views.fonts import fonts as fnt
@@ -43,6 +44,15 @@ class TitleView(ctk.CTkFrame):
         super().__init__(parent)
         self.main = main
         self.btns: List = []
+        # Decode the button icons in the background while the rest of the view is built.
+        icons = ["authenticate.png", "website.png", "settings.png"]
+        if main.DEV_MODE:
+            icons += ["scraper.png", "color.png"]
+        preload_icons(icons)
+        # Popup windows by name, so that reopening one shows it rather than a copy.
+        self._popups: Dict[str, ctk.CTkToplevel] = {}
+        # Views of popups that pause their timers while hidden, by the same names.
+        self._popup_views: Dict[str, Union[SpriteScraperView, ColorFilterView]] = {}
 
         self._setup_grid()
         self._create_main_splash()
@@ -52,8 +62,8 @@ class TitleView(ctk.CTkFrame):
         self._create_website_button()
         self._create_settings_button()
         if main.DEV_MODE:
-            self._create_scraper_button()
-            self._create_color_filter_button()
+            # Developer tools are not needed to show the view, so build them once idle.
+            self.after_idle(self._create_dev_buttons)
 
     # --- Main `TitleView` Creation Steps ---
     def _setup_grid(self) -> None:
@@ -67,10 +77,9 @@ class TitleView(ctk.CTkFrame):
     def _create_main_splash(self) -> None:
         """Load the main RuneDark logo to be displayed on the title view."""
         self.corner_icon_path = PATH_UI / "logo-corner.ico"
-        self.logo = ImageTk.PhotoImage(
-            Image.open(PATH_UI / "splash.png"),
-            Image.LANCZOS,
-        )
+        # Tk keeps its own copy of the pixels, so the PIL image and file are released.
+        with Image.open(PATH_UI / "splash.png") as img:
+            self.logo = ImageTk.PhotoImage(img)
         self.label_logo = ctk.CTkLabel(
             self, image=self.logo, text="", font=fnt.body_med_font()
         )
@@ -96,9 +105,10 @@ class TitleView(ctk.CTkFrame):
 
     def _create_cached_settings_text(self) -> None:
         """Display the status of cached settings."""
-        username = "Found" if settings.get("username") else "Not Found"
-        subscription_key = "Found" if settings.get("subscription_key") else "Not Found"
-        keybind = "Found" if settings.get("keybind") else "Not Found"
+        cached = settings.get_many(("username", "subscription_key", "keybind"))
+        username = "Found" if cached["username"] else "Not Found"
+        subscription_key = "Found" if cached["subscription_key"] else "Not Found"
+        keybind = "Found" if cached["keybind"] else "Not Found"
         txt_cached = (
             "  Cached..."
             f"\n  Username: {username}"
@@ -128,10 +138,7 @@ class TitleView(ctk.CTkFrame):
         In the future, authentication information will be a combination of RuneDark
         username and an active subscription key.
         """
-        self.auth_logo = ImageTk.PhotoImage(
-            Image.open(PATH_UI / "authenticate.png").resize((IMG_SIZE, IMG_SIZE)),
-            Image.LANCZOS,
-        )
+        self.auth_logo = load_ctk_icon("authenticate.png", IMG_SIZE)
         self.btn_auth = ctk.CTkButton(
             master=self,
             text="Authenticate",
@@ -149,10 +156,7 @@ class TitleView(ctk.CTkFrame):
 
     def _create_website_button(self) -> None:
         """Create a button to prompt a website pop-up in a default browser."""
-        self.website_logo = ImageTk.PhotoImage(
-            Image.open(PATH_UI / "website.png").resize((IMG_SIZE, IMG_SIZE)),
-            Image.LANCZOS,
-        )
+        self.website_logo = load_ctk_icon("website.png", IMG_SIZE)
         self.btn_website = ctk.CTkButton(
             master=self,
             text="Website",
@@ -172,10 +176,7 @@ class TitleView(ctk.CTkFrame):
 
     def _create_settings_button(self) -> None:
         """Create a button to access keybind settings."""
-        self.img_settings = ImageTk.PhotoImage(
-            Image.open(PATH_UI / "settings.png").resize((IMG_SIZE, IMG_SIZE)),
-            Image.Resampling.LANCZOS,
-        )
+        self.img_settings = load_ctk_icon("settings.png", IMG_SIZE)
         self.btn_settings = ctk.CTkButton(
             master=self,
             text="Settings",
@@ -195,10 +196,7 @@ class TitleView(ctk.CTkFrame):
 
     def _create_scraper_button(self) -> None:
         """Create a scraper button for the item sprite scraper utility."""
-        self.scraper_logo = ImageTk.PhotoImage(
-            Image.open(PATH_UI / "scraper.png").resize((IMG_SIZE, IMG_SIZE)),
-            Image.LANCZOS,
-        )
+        self.scraper_logo = load_ctk_icon("scraper.png", IMG_SIZE)
         self.btn_sprite_scraper = ctk.CTkButton(
             master=self,
             text="Scraper",
@@ -218,10 +216,7 @@ class TitleView(ctk.CTkFrame):
 
     def _create_color_filter_button(self) -> None:
         """Create a color filter button for the RGB-HSV color filter utility."""
-        self.color_filter_logo = ImageTk.PhotoImage(
-            Image.open(PATH_UI / "color.png").resize((IMG_SIZE, IMG_SIZE)),
-            Image.LANCZOS,
-        )
+        self.color_filter_logo = load_ctk_icon("color.png", IMG_SIZE)
         self.btn_color_filter = ctk.CTkButton(
             master=self,
             text="Color Filter",
@@ -239,6 +234,13 @@ class TitleView(ctk.CTkFrame):
         self.btn_color_filter.grid(row=2, column=2, padx=PADX, pady=PADY, sticky="ew")
         self.btns.append(self.btn_color_filter)
 
+    def _create_dev_buttons(self) -> None:
+        """Create the buttons for developer-only utilities."""
+        self._create_scraper_button()
+        self._create_color_filter_button()
+        if self.main.auth:  # Authentication finished before these buttons existed.
+            self._toggle_ui()
+
     # --- Utility Functions ---
     def _toggle_ui(self) -> None:
         """Enable or disable the UI based on whether authentication was successful."""
@@ -255,6 +257,25 @@ class TitleView(ctk.CTkFrame):
                 for btn_bot in bot_btns:
                     btn_bot.configure(state=state)
 
+    def __show_popup(self, name: str) -> bool:
+        """Show a previously opened popup window again, if it still exists.
+
+        Args:
+            name (str): The name the popup window was stored under in `_popups`.
+
+        Returns:
+            bool: True if the popup was shown, or False if it must be (re)built.
+        """
+        window = self._popups.get(name)
+        if window is None or not window.winfo_exists():
+            return False
+        if name in self._popup_views:
+            self._popup_views[name].show()
+        else:
+            window.deiconify()
+            window.lift()
+        return True
+
     # --- Button Handlers ---
     def __on_auth_clicked(self) -> None:
         """Open Authentication as a popup after the associated button is clicked.
@@ -272,7 +293,10 @@ class TitleView(ctk.CTkFrame):
                 return
 
         # Open the AuthView window if there's no cached key or if authentication failed.
+        if self.__show_popup("auth"):
+            return
         window = ctk.CTkToplevel(master=self)
+        self._popups["auth"] = window
         # The following line of code executes after a 201ms delay.
         # See: https://tinyurl.com/mvw55pkd
         self.after(
@@ -282,7 +306,7 @@ class TitleView(ctk.CTkFrame):
         window.attributes("-topmost", True)
         window.title("Authentication")
         window.geometry("430x660")  # [TO DEV] Remove this hardcoding.
-        self.update()
+        self.update_idletasks()
         view = AuthView(parent=window, on_success_callback=self.__on_auth_success)
         view.pack(side="top", fill="both", expand=True, padx=PADX, pady=0)
 
@@ -298,7 +322,10 @@ class TitleView(ctk.CTkFrame):
 
     def __on_settings_clicked(self) -> None:
         """Open Settings as a popup after the associated button is clicked."""
+        if self.__show_popup("settings"):
+            return
         window = ctk.CTkToplevel(master=self)
+        self._popups["settings"] = window
         # The following line of code executes after a 201ms delay.
         # See: https://tinyurl.com/mvw55pkd
         self.after(
@@ -308,13 +335,16 @@ class TitleView(ctk.CTkFrame):
         window.attributes("-topmost", True)
         window.title("Settings")
         window.geometry("564x364")  # [TO DEV] Remove this hardcoding.
-        self.update()
+        self.update_idletasks()
         view = SettingsView(parent=window)
         view.pack(side="top", fill="both", expand=True, padx=PADX, pady=0)
 
     def __on_scraper_clicked(self) -> None:
-        """Open the sprite scraper window."""
+        """Open the sprite scraper window, reusing it if it was opened before."""
+        if self.__show_popup("scraper"):
+            return
         window = ctk.CTkToplevel(master=self)
+        self._popups["scraper"] = window
         self.after(
             201,
             lambda: window.iconbitmap(self.corner_icon_path),
@@ -324,10 +354,14 @@ class TitleView(ctk.CTkFrame):
         window.title("OSRS Wiki Sprite Scraper")
         view = SpriteScraperView(parent=window)
         view.pack(side="top", fill="both", expand=True, padx=0, pady=0)
+        self._popup_views["scraper"] = view
 
     def __on_color_filter_clicked(self) -> None:
-        """Open the HSV-RGB color filter interface."""
+        """Open the HSV-RGB color filter interface, reusing it if opened before."""
+        if self.__show_popup("color_filter"):
+            return
         window = ctk.CTkToplevel(master=self)
+        self._popups["color_filter"] = window
         self.after(
             201,
             lambda: window.iconbitmap(self.corner_icon_path),
@@ -337,3 +371,4 @@ class TitleView(ctk.CTkFrame):
         window.title("Color Filter")
         view = ColorFilterView(parent=window)
         view.pack(side="top", fill="both", expand=True, padx=0, pady=0)
+        self._popup_views["color_filter"] = view